@@ -0,0 +1,168 @@
+# Cascading Critical Node Removal - Headless Fragmentation Curves
+#
+# critical_node_attack.py removes the top-2 betweenness drones and then
+# rebuilds a fresh random graph, so fragmentation is never measured.  This
+# cascade mode keeps one fixed clustered swarm and removes drones greedily by
+# betweenness until nothing is left:
+#   - "adaptive": every RECOMPUTE_EVERY removals betweenness is recomputed only
+#     inside the component(s) the removed drones belonged to (pivot-sampled
+#     for large components, skipped for components of one or two drones)
+#   - "static": betweenness is computed once on the intact swarm
+# Component count and giant-component size for every prefix of the removal
+# order are then tracked with a union-find that adds drones back in reverse
+# order, which is near-linear instead of one connectivity scan per removal.
+import os
+import time
+
+import matplotlib.pyplot as plt
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+# === Cascade Configuration ===
+N_DRONES = 1000
+N_CLUSTERS = 10
+INTRA_DEGREE = 6          # expected links to drones in the same cluster
+INTER_DEGREE = 2          # expected links to drones in other clusters
+PIVOTS = 32               # betweenness source samples for large components (None = exact)
+RECOMPUTE_EVERY = 5       # adaptive mode: removals between betweenness refreshes
+SEED = 42
+
+RESULT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "result")
+
+
+# === Swarm Construction ===
+def build_clustered_swarm(n_drones=N_DRONES, n_clusters=N_CLUSTERS, intra_degree=INTRA_DEGREE,
+                          inter_degree=INTER_DEGREE, seed=SEED):
+    """Fixed clustered swarm with the same intra/inter-cluster structure as critical_node_attack.py."""
+    sizes = [n_drones // n_clusters + (1 if i < n_drones % n_clusters else 0) for i in range(n_clusters)]
+    p_intra = min(1.0, intra_degree / max(1, max(sizes) - 1))
+    p_inter = min(1.0, inter_degree / max(1, n_drones - max(sizes)))
+    probs = [[p_intra if i == j else p_inter for j in range(n_clusters)] for i in range(n_clusters)]
+    G = nx.stochastic_block_model(sizes, probs, seed=seed, sparse=True)
+    return nx.relabel_nodes(G, {i: f"Drone{i + 1}" for i in G.nodes()})
+
+
+# === Removal Order ===
+def _betweenness(G, pivots, seed):
+    """Unnormalized betweenness; values of separate components are directly comparable."""
+    k = pivots if pivots is not None and pivots < len(G) else None
+    return nx.betweenness_centrality(G, k=k, normalized=False, seed=seed)
+
+
+def removal_order(G, strategy="adaptive", pivots=PIVOTS, recompute_every=RECOMPUTE_EVERY, seed=SEED):
+    """Greedy highest-betweenness removal order over the whole swarm."""
+    H = G.copy()
+    scores = _betweenness(H, pivots, seed)
+    order = []
+    dirty = set()
+
+    while len(H):
+        drone = max(scores, key=scores.get)
+        dirty.update(H[drone])
+        dirty.discard(drone)
+        H.remove_node(drone)
+        del scores[drone]
+        order.append(drone)
+
+        if strategy != "adaptive" or len(order) % recompute_every and len(H):
+            continue
+
+        # Incremental refresh: only components touched by the removals since the last refresh
+        seen = set()
+        for u in dirty:
+            if u in seen or u not in H:
+                continue
+            component = nx.node_connected_component(H, u)
+            seen |= component
+            if len(component) <= 2:
+                scores.update(dict.fromkeys(component, 0.0))
+            else:
+                scores.update(_betweenness(H.subgraph(component).copy(), pivots, seed))
+        dirty.clear()
+    return order
+
+
+# === Connectivity Tracking ===
+def fragmentation_curve(G, order):
+    """
+    Components and giant-component size after removing the first k drones, for k = 0..n.
+    Computed with union-find by re-adding drones in reverse removal order.
+    """
+    n = len(order)
+    index = {drone: i for i, drone in enumerate(order)}
+    parent = list(range(n))
+    size = [1] * n
+    present = [False] * n
+
+    def find(i):
+        root = i
+        while parent[root] != root:
+            root = parent[root]
+        while parent[i] != root:
+            parent[i], i = root, parent[i]
+        return root
+
+    components = np.zeros(n + 1, dtype=np.int64)
+    giant = np.zeros(n + 1, dtype=np.int64)
+    n_components = 0
+    largest = 0
+    for step in range(n - 1, -1, -1):
+        i = index[order[step]]
+        present[i] = True
+        n_components += 1
+        for nbr in G[order[step]]:
+            j = index[nbr]
+            if not present[j]:
+                continue
+            ri, rj = find(i), find(j)
+            if ri != rj:
+                if size[ri] < size[rj]:
+                    ri, rj = rj, ri
+                parent[rj] = ri
+                size[ri] += size[rj]
+                n_components -= 1
+                i = ri
+        largest = max(largest, size[find(i)])
+        components[step] = n_components
+        giant[step] = largest
+
+    return pd.DataFrame({
+        "Removed": np.arange(n + 1),
+        "Drone Removed": [None] + list(order),
+        "Components": components,
+        "Giant Size": giant,
+        "Giant Fraction": giant / n
+    })
+
+
+def run_cascade(G, strategy="adaptive", **kwargs):
+    start = time.time()
+    order = removal_order(G, strategy, **kwargs)
+    curve = fragmentation_curve(G, order)
+    return curve, time.time() - start
+
+
+if __name__ == "__main__":
+    G = build_clustered_swarm()
+    print(f"[INFO] Swarm: {G.number_of_nodes()} drones, {G.number_of_edges()} links")
+
+    plt.figure(figsize=(10, 6))
+    for strategy, color in (("adaptive", "red"), ("static", "gray")):
+        curve, elapsed = run_cascade(G, strategy)
+        half = curve.loc[curve["Giant Fraction"] <= 0.5, "Removed"].iloc[0]
+        print(f"[INFO] {strategy}: full cascade in {elapsed:.2f}s, "
+              f"giant component halved after {half} removals ({half / len(G):.1%})")
+        plt.plot(curve["Removed"] / len(G), curve["Giant Fraction"], label=f"{strategy.title()} betweenness",
+                 color=color, linewidth=2)
+
+    plt.title("Critical Node Cascade - Swarm Fragmentation")
+    plt.xlabel("Fraction of Drones Removed")
+    plt.ylabel("Giant Component Fraction")
+    plt.legend()
+    plt.grid(True)
+    plt.tight_layout()
+
+    save_path = os.path.join(RESULT_DIR, "critical_node_cascade.png")
+    plt.savefig(save_path, dpi=300)
+    print(f"\n✅ Critical node cascade complete. Figure saved to:\n{save_path}")
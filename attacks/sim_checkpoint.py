@@ -0,0 +1,127 @@
+# Simulation Checkpointing - Resume, Deterministic Replay and Forking
+#
+# Every iteration boundary of a SwarmSimulation run can be written as a
+# compact compressed .npz checkpoint holding the graph, the per-drone
+# attribute arrays, the counters and the Mersenne Twister state.  Loading a
+# checkpoint and stepping it reproduces the original run bit for bit, and
+# fork() launches many alternative branches (different attack, different
+# seed) from one checkpoint in parallel worker processes.
+import csv
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from swarm_simulation import CSV_HEADER, SwarmSimulation
+
+
+def checkpoint_path(checkpoint_dir, iteration):
+    return os.path.join(checkpoint_dir, f"checkpoint_{iteration:04d}.npz")
+
+
+def save_checkpoint(sim, path):
+    np.savez_compressed(path, **sim.get_state())
+
+
+def load_checkpoint(path):
+    with np.load(path, allow_pickle=False) as data:
+        return SwarmSimulation.from_state({k: data[k] for k in data.files})
+
+
+def latest_checkpoint(checkpoint_dir):
+    paths = sorted(glob.glob(os.path.join(checkpoint_dir, "checkpoint_*.npz")))
+    return paths[-1] if paths else None
+
+
+def _append_csv(csv_path, records):
+    new_file = not os.path.exists(csv_path)
+    with open(csv_path, "a", newline="") as file:
+        writer = csv.writer(file)
+        if new_file:
+            writer.writerow(CSV_HEADER)
+        writer.writerows(zip(*(records[col] for col in CSV_HEADER)))
+
+
+def run_with_checkpoints(sim, n_iterations, checkpoint_dir, csv_path=None):
+    """
+    Steps the simulation up to iteration n_iterations, checkpointing before every step.
+    Returns the logged rows as a DataFrame (and appends them to csv_path if given).
+    """
+    os.makedirs(checkpoint_dir, exist_ok=True)
+    frames = []
+    while sim.iteration < n_iterations:
+        save_checkpoint(sim, checkpoint_path(checkpoint_dir, sim.iteration))
+        records = sim.step()
+        if csv_path:
+            _append_csv(csv_path, records)
+        frames.append(pd.DataFrame(records, columns=CSV_HEADER))
+    save_checkpoint(sim, checkpoint_path(checkpoint_dir, sim.iteration))
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=CSV_HEADER)
+
+
+def resume(checkpoint_dir, n_iterations, csv_path=None):
+    """Continues a run from its latest checkpoint up to iteration n_iterations."""
+    path = latest_checkpoint(checkpoint_dir)
+    if path is None:
+        raise FileNotFoundError(f"No checkpoints in {checkpoint_dir}")
+    return run_with_checkpoints(load_checkpoint(path), n_iterations, checkpoint_dir, csv_path)
+
+
+def replay(path, n_steps):
+    """Deterministically re-runs n_steps iterations from one checkpoint; nothing is written."""
+    sim = load_checkpoint(path)
+    frames = [pd.DataFrame(sim.step(), columns=CSV_HEADER) for _ in range(n_steps)]
+    return pd.concat(frames, ignore_index=True)
+
+
+def _run_branch(path, branch, n_steps):
+    sim = load_checkpoint(path)
+    if "seed" in branch:
+        sim.rng.seed(branch["seed"])
+    if branch.get("attack", sim.attack) != sim.attack:
+        # The checkpointed edges belong to the old attack's network (data manipulation keeps
+        # one network between resets), so the branch starts from a fresh one
+        sim.attack = branch["attack"]
+        sim.edges = sim.build_edges()
+        sim.G = sim.build_graph()
+    frames = [pd.DataFrame(sim.step(), columns=CSV_HEADER) for _ in range(n_steps)]
+    return pd.concat(frames, ignore_index=True)
+
+
+def fork(path, branches, n_steps, max_workers=None):
+    """
+    Runs alternative futures from one checkpoint in parallel.
+    branches: {name: {"attack": ..., "seed": ...}} (either key optional)
+    Returns {name: DataFrame of logged rows}.
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {name: pool.submit(_run_branch, path, branch, n_steps) for name, branch in branches.items()}
+        return {name: f.result() for name, f in futures.items()}
+
+
+if __name__ == "__main__":
+    checkpoint_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "checkpoints", "sybil")
+
+    start = time.time()
+    original = run_with_checkpoints(SwarmSimulation("sybil", seed=42), 15, checkpoint_dir)
+    print(f"[INFO] 15 iterations with checkpoints in {time.time() - start:.2f}s "
+          f"({os.path.getsize(checkpoint_path(checkpoint_dir, 12))} bytes per checkpoint)")
+
+    replayed = replay(checkpoint_path(checkpoint_dir, 12), 3)
+    expected = original[original["Iteration"] >= 12].reset_index(drop=True)
+    print(f"[INFO] Replay from iteration 12 identical to original run: {replayed.equals(expected)}")
+
+    branches = {
+        "sybil_seed_1": {"seed": 1},
+        "sybil_seed_2": {"seed": 2},
+        "switch_to_mitm": {"attack": "mitm"},
+        "switch_to_critical_node": {"attack": "critical_node"},
+        "switch_to_data_manipulation": {"attack": "data_manipulation"}
+    }
+    for name, df in fork(checkpoint_path(checkpoint_dir, 12), branches, 3).items():
+        print(f"  {name}: {len(df)} rows, {(df['Trust Status'] == 'MALICIOUS').sum()} flagged malicious")
+
+    print(f"\n✅ Checkpoints saved to:\n{checkpoint_dir}")
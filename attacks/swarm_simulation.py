@@ -0,0 +1,260 @@
+# Headless Swarm Simulation - Explicit State for All Four Attacks
+#
+# The attack scripts keep their state in module globals (G, removed_drones,
+# attack_count, attributes) and draw from the global `random` module, so a run
+# can only be reproduced from iteration 0 with AirSim attached.  This module
+# re-implements one iteration of each attack script as SwarmSimulation.step()
+# with every piece of state (graph, per-drone attributes, counters and a
+# private random.Random) held on the object, so it can be checkpointed,
+# replayed and forked (see sim_checkpoint.py).  No AirSim or plotting.
+import random
+
+import networkx as nx
+import numpy as np
+
+ATTACKS = ("critical_node", "data_manipulation", "mitm", "sybil")
+
+CSV_HEADER = [
+    "Iteration", "Drone", "Connected To", "Attack Type", "Trust Status",
+    "Degree Centrality", "Betweenness Centrality", "Closeness Centrality", "Eigenvector Centrality",
+    "Battery Level", "Sensor Functionality", "Relative Speed", "Location Accuracy",
+    "Communication Intensity", "Communication Scale", "Latency", "Data Throughput",
+    "Packet Loss", "Swarm Coordination Rate", "Trust Score",
+    "Speed Match", "Sensor Match", "Centrality Match", "Total Times Attacked"
+]
+
+# Attribute key -> (sampler, low, high), same ranges as reset_attributes() in the scripts
+ATTRIBUTE_RANGES = {
+    'battery': ("randint", 50, 100),
+    'sensor': ("uniform", 0.8, 1.0),
+    'speed': ("uniform", 0.8, 1.2),
+    'location': ("uniform", 0.9, 1.0),
+    'intensity': ("randint", 5, 20),
+    'scale': ("randint", 1, 3),
+    'latency': ("uniform", 0.01, 0.1),
+    'throughput': ("randint", 100, 500),
+    'packet': ("uniform", 0.0, 0.05),
+    'coord_rate': ("uniform", 0.8, 1.0),
+    'trust_score': ("uniform", 0.7, 1.0)
+}
+ATTRIBUTE_COLUMNS = {
+    'battery': "Battery Level", 'sensor': "Sensor Functionality", 'speed': "Relative Speed",
+    'location': "Location Accuracy", 'intensity': "Communication Intensity", 'scale': "Communication Scale",
+    'latency': "Latency", 'throughput': "Data Throughput", 'packet': "Packet Loss",
+    'coord_rate': "Swarm Coordination Rate", 'trust_score': "Trust Score"
+}
+
+ATTACK_LABELS = {
+    "critical_node": "Critical Node Attack",
+    "data_manipulation": "Data Manipulation",
+    "mitm": "MITM Attack",
+    "sybil": "Sybil Impersonated"
+}
+
+
+class SwarmSimulation:
+    def __init__(self, attack, n_drones=9, n_clusters=3, seed=42, reset_every=5):
+        if attack not in ATTACKS:
+            raise ValueError(f"Unknown attack: {attack}")
+        self.attack = attack
+        self.n_drones = n_drones
+        self.n_clusters = n_clusters
+        self.reset_every = reset_every
+        self.rng = random.Random(seed)
+
+        self.drones = [f"Drone{i + 1}" for i in range(n_drones)]
+        size = -(-n_drones // n_clusters)
+        self.clusters = [self.drones[i:i + size] for i in range(0, n_drones, size)]
+
+        self.iteration = 0
+        self.removed = set()
+        self.attack_count = {d: 0 for d in self.drones}
+        self.sybil_counter = 0
+        self.attributes = self.reset_attributes()
+        self.edges = self.build_edges() if attack == "data_manipulation" else []
+        self.G = nx.Graph()
+
+    # === State Reset ===
+    def reset_attributes(self):
+        attributes = {}
+        for key, (sampler, low, high) in ATTRIBUTE_RANGES.items():
+            draw = self.rng.randint if sampler == "randint" else self.rng.uniform
+            attributes[key] = {d: draw(low, high) for d in self.drones}
+        return attributes
+
+    def build_edges(self):
+        """Clustered random links over the active drones (sybil uses one flat p=0.5 cluster)."""
+        active = [d for d in self.drones if d not in self.removed]
+        edges = []
+
+        if self.attack == "sybil":
+            for i in range(len(active)):
+                for j in range(i + 1, len(active)):
+                    if self.rng.random() > 0.5:
+                        edges.append((active[i], active[j], self.rng.randint(10, 20)))
+            return edges
+
+        for cluster in self.clusters:
+            members = [d for d in cluster if d not in self.removed]
+            for i in range(len(members)):
+                for j in range(i + 1, len(members)):
+                    if self.rng.random() > 0.5:
+                        edges.append((members[i], members[j], self.rng.randint(10, 20)))
+        for i in range(len(active)):
+            for j in range(i + 1, len(active)):
+                if self.rng.random() > 0.7:
+                    edges.append((active[i], active[j], self.rng.randint(10, 20)))
+        return edges
+
+    def build_graph(self):
+        """
+        Graph of the active drones from the ordered edge list.
+        Data manipulation keeps removed drones (and their links) in its fixed
+        network, as data_manipulation_attack.py does; they are only skipped as
+        targets and in the log.
+        Edges are kept in insertion order so neighbor order (and therefore every
+        centrality value) is identical after a checkpoint round trip.
+        """
+        G = nx.Graph()
+        G.add_nodes_from(d for d in self.drones if d not in self.removed or self.attack == "data_manipulation")
+        G.add_edges_from((u, v, {'weight': w}) for u, v, w in self.edges)
+        return G
+
+    # === Attack Logic ===
+    def _apply_attack(self):
+        """Mutates self.G for this iteration; returns (attacks, targets, skipped_nodes)."""
+        attacks = {d: "Trustworthy" for d in self.G.nodes()}
+        candidates = [d for d in self.G.nodes() if d not in self.removed]
+        if not candidates:
+            return attacks, [], set()
+
+        if self.attack == "critical_node":
+            centrality = nx.betweenness_centrality(self.G)
+            targets = sorted(centrality, key=centrality.get, reverse=True)[:2]
+            return attacks, targets, set()
+
+        if self.attack == "data_manipulation":
+            return attacks, [self.rng.choice(candidates)], set()
+
+        if self.attack == "mitm":
+            target = self.rng.choice(candidates)
+            self.G.add_node("FakeNode")
+            self.G.add_edge(target, "FakeNode")
+            return attacks, [target], {"FakeNode"}
+
+        targets = self.rng.sample(candidates, min(len(candidates), self.rng.randint(1, 2)))
+        sybils = set()
+        for target in targets:
+            sybil_name = f"Sybil_{self.sybil_counter}"
+            self.sybil_counter += 1
+            self.G.add_node(sybil_name)
+            self.G.add_edge(sybil_name, target, weight=self.rng.randint(5, 15))
+            sybils.add(sybil_name)
+        return attacks, targets, sybils
+
+    def step(self):
+        """Runs one iteration; returns the logged rows as a dict of CSV_HEADER columns."""
+        if self.iteration % self.reset_every == 0 and self.iteration != 0:
+            self.removed.clear()
+            self.sybil_counter = 0
+            self.attributes = self.reset_attributes()
+            if self.attack == "data_manipulation":
+                self.edges = self.build_edges()
+
+        # Data manipulation keeps one network between resets; the others re-link every iteration
+        if self.attack != "data_manipulation":
+            self.edges = self.build_edges()
+        self.G = self.build_graph()
+
+        attacks, targets, skipped = self._apply_attack()
+        label = ATTACK_LABELS[self.attack]
+        for target in targets:
+            attacks[target] = label
+            self.attack_count[target] += 1
+
+        G = self.G
+        deg = nx.degree_centrality(G)
+        bet = nx.betweenness_centrality(G)
+        close = nx.closeness_centrality(G)
+        try:
+            eig = nx.eigenvector_centrality(G, max_iter=1000)
+        except Exception:
+            eig = {}
+
+        records = {col: [] for col in CSV_HEADER}
+        for drone in list(G.nodes()):
+            if drone in skipped or (drone in self.removed and self.attack != "critical_node"):
+                continue
+
+            attack_type = attacks.get(drone, "")
+            is_attacked = drone in targets
+            predicted = {'speed': self.attributes['speed'][drone], 'sensor_ok': 1, 'centrality': deg.get(drone, 0)}
+            actual = {
+                'speed': predicted['speed'] + (self.rng.uniform(0.3, 0.6) if is_attacked else 0),
+                'sensor_ok': 0 if is_attacked else 1,
+                'centrality': max(0.0, predicted['centrality'] - (0.3 if is_attacked else 0))
+            }
+            delta = {k: abs(predicted[p] - actual[p]) for k, p in
+                     (('speed', 'speed'), ('sensor', 'sensor_ok'), ('centrality', 'centrality'))}
+
+            if self.attack != "critical_node" and attack_type == "Trustworthy":
+                attack_type = ""
+            row = {
+                "Iteration": self.iteration, "Drone": drone, "Connected To": list(G.neighbors(drone)),
+                "Attack Type": attack_type,
+                "Trust Status": "MALICIOUS" if any(v > 0.1 for v in delta.values()) else "TRUSTED",
+                "Degree Centrality": deg.get(drone, 0), "Betweenness Centrality": bet.get(drone, 0),
+                "Closeness Centrality": close.get(drone, 0), "Eigenvector Centrality": eig.get(drone, 0),
+                "Speed Match": "Matched" if delta['speed'] <= 0.1 else "Mismatched",
+                "Sensor Match": "Matched" if delta['sensor'] <= 0.1 else "Mismatched",
+                "Centrality Match": "Matched" if delta['centrality'] <= 0.1 else "Mismatched",
+                "Total Times Attacked": self.attack_count[drone]
+            }
+            for key, column in ATTRIBUTE_COLUMNS.items():
+                row[column] = self.attributes[key][drone]
+            for col in CSV_HEADER:
+                records[col].append(row[col])
+
+        for target in targets:
+            self.removed.add(target)
+        self.iteration += 1
+        return records
+
+    # === Explicit State (used by sim_checkpoint.py) ===
+    def get_state(self):
+        """Full simulation state as a flat dict of NumPy arrays (no pickling needed)."""
+        drone_index = {d: i for i, d in enumerate(self.drones)}
+        edges = np.array([(drone_index[u], drone_index[v], w) for u, v, w in self.edges], dtype=np.int32).reshape(-1, 3)
+        version, mt_state, gauss = self.rng.getstate()
+
+        state = {
+            "attack": np.array(self.attack),
+            "config": np.array([self.n_drones, self.n_clusters, self.reset_every], dtype=np.int64),
+            "counters": np.array([self.iteration, self.sybil_counter], dtype=np.int64),
+            "removed": np.array([d in self.removed for d in self.drones]),
+            "attack_count": np.array([self.attack_count[d] for d in self.drones], dtype=np.int64),
+            "edges": edges,
+            "rng_state": np.array(mt_state, dtype=np.uint32),
+            "rng_meta": np.array([version, np.nan if gauss is None else gauss], dtype=np.float64)
+        }
+        for key, (sampler, _, _) in ATTRIBUTE_RANGES.items():
+            dtype = np.int64 if sampler == "randint" else np.float64
+            state["attr_" + key] = np.array([self.attributes[key][d] for d in self.drones], dtype=dtype)
+        return state
+
+    @classmethod
+    def from_state(cls, state):
+        n_drones, n_clusters, reset_every = (int(v) for v in state["config"])
+        sim = cls(str(state["attack"]), n_drones, n_clusters, seed=0, reset_every=reset_every)
+        sim.iteration, sim.sybil_counter = (int(v) for v in state["counters"])
+        sim.removed = {d for d, r in zip(sim.drones, state["removed"]) if r}
+        sim.attack_count = {d: int(c) for d, c in zip(sim.drones, state["attack_count"])}
+        for key in ATTRIBUTE_RANGES:
+            sim.attributes[key] = {d: v.item() for d, v in zip(sim.drones, state["attr_" + key])}
+        sim.edges = [(sim.drones[u], sim.drones[v], int(w)) for u, v, w in state["edges"]]
+        sim.G = sim.build_graph()
+
+        version, gauss = state["rng_meta"]
+        sim.rng.setstate((int(version), tuple(int(x) for x in state["rng_state"]),
+                          None if np.isnan(gauss) else float(gauss)))
+        return sim
@@ -0,0 +1,166 @@
+# Sybil Flood Stress Mode - Headless, Sparse Structural Detection Features
+#
+# sybil_attack.py injects one or two Sybil nodes per iteration.  This stress
+# mode floods the swarm with hundreds to thousands of Sybil identities and
+# computes structural detection features for every real drone with
+# scipy.sparse operations only (no NetworkX per-node loops):
+#   - local clustering coefficient
+#   - random-walk trust propagation (SybilRank-style, seeded at known-honest drones)
+#   - low-trust neighbor ratio (share of neighbors below the bottom roster trust quantile)
+# Every feature uses only what a verifier can observe (links and a handful of
+# known-honest drones), never the true Sybil labels.
+# No AirSim connection is needed, so it runs at any swarm size.
+import time
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+from threshold_sweep import threshold_sweep, summarize
+
+# === Stress Configuration ===
+N_DRONES = 500
+FLOOD_SIZES = [100, 500, 1000, 5000]
+ATTACHMENT = "region"        # "single", "spray", "targeted" or "region"
+REAL_DEGREE = 8              # average honest-honest degree
+SYBIL_DEGREE = 6             # average Sybil-Sybil degree ("region" pattern)
+ATTACK_EDGES = 2             # edges from each Sybil into the real swarm ("spray"/"targeted")
+N_TARGETS = 20               # real drones attacked by the "targeted"/"region" patterns
+N_TRUST_SEEDS = 10           # known-honest drones that seed trust propagation
+LOW_TRUST_QUANTILE = 0.25    # nodes below this quantile of roster-drone trust count as low-trust neighbors
+SEED = 42
+
+
+# === Graph Construction ===
+def random_edges(nodes, avg_degree, rng):
+    """Erdos-Renyi style edge list over the given node ids with the requested average degree."""
+    n = len(nodes)
+    m = int(n * avg_degree / 2)
+    if n < 2 or m == 0:
+        return np.empty((0, 2), dtype=np.int64)
+    u = rng.integers(0, n, size=m)
+    v = rng.integers(0, n, size=m)
+    keep = u != v
+    return np.column_stack([nodes[u[keep]], nodes[v[keep]]])
+
+
+def inject_sybils(n_drones, n_sybils, pattern, rng, attack_edges=ATTACK_EDGES, n_targets=N_TARGETS,
+                  sybil_degree=SYBIL_DEGREE):
+    """
+    Returns the Sybil edge list; Sybil ids are n_drones .. n_drones + n_sybils - 1.
+      single   - each Sybil attaches to one random drone (sybil_attack.py behaviour)
+      spray    - each Sybil attaches to attack_edges random drones
+      targeted - each Sybil attaches to attack_edges drones from a fixed target set
+      region   - Sybils form a dense region among themselves, linked to the target set
+    """
+    sybils = np.arange(n_drones, n_drones + n_sybils)
+    if pattern == "single":
+        return np.column_stack([sybils, rng.integers(0, n_drones, size=n_sybils)])
+    if pattern == "spray":
+        return np.column_stack([np.repeat(sybils, attack_edges),
+                                rng.integers(0, n_drones, size=n_sybils * attack_edges)])
+
+    targets = rng.choice(n_drones, size=min(n_targets, n_drones), replace=False)
+    if pattern == "targeted":
+        return np.column_stack([np.repeat(sybils, attack_edges),
+                                rng.choice(targets, size=n_sybils * attack_edges)])
+    if pattern == "region":
+        internal = random_edges(sybils, sybil_degree, rng)
+        # Few attack edges: every target gets at least one, the rest are spread over the region
+        n_attack = max(len(targets), n_sybils // 10)
+        attack = np.column_stack([rng.choice(sybils, size=n_attack),
+                                  np.resize(targets, n_attack)])
+        return np.vstack([internal, attack])
+    raise ValueError(f"Unknown attachment pattern: {pattern}")
+
+
+def adjacency(n_nodes, edges):
+    """Symmetric, binary CSR adjacency without self-loops or duplicate edges."""
+    A = sp.coo_matrix((np.ones(len(edges)), (edges[:, 0], edges[:, 1])), shape=(n_nodes, n_nodes)).tocsr()
+    A = A + A.T
+    A.setdiag(0)
+    A.eliminate_zeros()
+    A.data[:] = 1.0
+    return A
+
+
+# === Sparse Structural Features ===
+def structural_features(A, n_drones, trust_seeds, walk_steps=None, low_trust_quantile=LOW_TRUST_QUANTILE):
+    """Features for the first n_drones rows (the real drones) of adjacency A."""
+    deg_all = np.asarray(A.sum(axis=1)).ravel()
+    A_real = A[:n_drones]
+    deg = deg_all[:n_drones]
+
+    # Triangles through each real drone: sum_j (A^2)_ij * A_ij / 2
+    triangles = np.asarray(A_real.dot(A).multiply(A_real).sum(axis=1)).ravel() / 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        clustering = np.where(deg > 1, 2 * triangles / (deg * (deg - 1)), 0.0)
+
+    # Trust propagation: early-terminated power iteration of the random walk from the seeds
+    n_nodes = A.shape[0]
+    walk_steps = walk_steps or int(np.ceil(np.log2(n_nodes)))
+    inv_deg = np.divide(1.0, deg_all, out=np.zeros_like(deg_all), where=deg_all > 0)
+    P_T = A.T.multiply(inv_deg).tocsr()  # column-normalized transition matrix
+    trust = np.zeros(n_nodes)
+    trust[trust_seeds] = 1.0 / len(trust_seeds)
+    for _ in range(walk_steps):
+        trust = P_T.dot(trust)
+    trust_rank = trust * inv_deg
+
+    # Neighbors whose degree-normalized trust is below the bottom quantile of the roster drones
+    low_trust = (trust_rank < np.quantile(trust_rank[:n_drones], low_trust_quantile)).astype(np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        low_trust_ratio = np.where(deg > 0, A_real.dot(low_trust) / deg, 0.0)
+
+    return {
+        "Degree": deg,
+        "Clustering": clustering,
+        "Low-Trust Neighbor Ratio": low_trust_ratio,
+        "Trust Rank": trust_rank[:n_drones]
+    }
+
+
+def run_flood(n_drones=N_DRONES, n_sybils=1000, pattern=ATTACHMENT, seed=SEED):
+    """Builds one flooded swarm and returns (per-drone DataFrame, elapsed seconds)."""
+    start = time.time()
+    rng = np.random.default_rng(seed)
+    drones = np.arange(n_drones)
+    real_edges = random_edges(drones, REAL_DEGREE, rng)
+    sybil_edges = inject_sybils(n_drones, n_sybils, pattern, rng)
+
+    n_nodes = n_drones + n_sybils
+    A = adjacency(n_nodes, np.vstack([real_edges, sybil_edges]))
+    attacked = np.asarray(A[:n_drones][:, n_drones:].sum(axis=1)).ravel() > 0
+
+    # Verifiers only know a handful of honest drones (any drone if the flood reached all of them)
+    honest = np.flatnonzero(~attacked) if not attacked.all() else drones
+    trust_seeds = rng.choice(honest, size=min(N_TRUST_SEEDS, len(honest)), replace=False)
+    features = structural_features(A, n_drones, trust_seeds)
+
+    df = pd.DataFrame({"Drone": [f"Drone{i + 1}" for i in drones], **features})
+    df["Attack Type"] = np.where(attacked, "Sybil Impersonated", "")
+    return df, time.time() - start
+
+
+def evaluate_detection(df):
+    """ROC AUC / best F1 of each feature as a detector for Sybil-impersonated drones."""
+    y_true = (df["Attack Type"] == "Sybil Impersonated").to_numpy()
+    detectors = {
+        "Clustering": -df["Clustering"].to_numpy(),          # low clustering -> suspicious
+        "Low-Trust Neighbor Ratio": df["Low-Trust Neighbor Ratio"].to_numpy(),
+        "Trust Rank": -df["Trust Rank"].to_numpy()           # low trust -> suspicious
+    }
+    return {name: summarize(threshold_sweep(y_true, scores)) for name, scores in detectors.items()}
+
+
+if __name__ == "__main__":
+    for n_sybils in FLOOD_SIZES:
+        df, elapsed = run_flood(n_sybils=n_sybils)
+        scores = evaluate_detection(df)
+        n_attacked = int((df["Attack Type"] != "").sum())
+        print(f"\n[INFO] {ATTACHMENT} flood: {n_sybils} Sybils, {N_DRONES} drones, "
+              f"{n_attacked} impersonated, features in {elapsed:.3f}s")
+        for name, summary in scores.items():
+            print(f"  {name:<22} ROC AUC={summary['ROC AUC']:.4f}  Best F1={summary['Best F1']:.4f}")
+
+    print("\n✅ Sybil flood stress run complete.")
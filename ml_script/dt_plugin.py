@@ -1,8 +1,10 @@
+import time
+
 import airsim
 
 class DigitalTwinPlugin:
-    def __init__(self):
-        self.client = airsim.MultirotorClient()
+    def __init__(self, client=None):
+        self.client = client or airsim.MultirotorClient()
         self.client.confirmConnection()
 
     def get_actual_metrics(self, drone_id):
@@ -54,3 +56,137 @@ class DigitalTwinPlugin:
             'centrality': abs(predicted_data['centrality'] - actual_data['centrality']),
             'sensor': abs(predicted_data['sensor_ok'] - actual_data['sensor_ok'])
         }
+
+
+class PredictiveDigitalTwinPlugin(DigitalTwinPlugin):
+    """
+    Dead-reckoning digital twin that cuts telemetry polling load.
+    Keeps a per-drone kinematic model (position, velocity, acceleration) updated
+    from sparse getMultirotorState polls and extrapolates it between polls, so
+    verification can run far more often than the backend is queried.
+    A real fetch happens only when the model's speed uncertainty crosses
+    uncertainty_bound, the last poll is older than max_poll_interval, or a
+    speed check against the extrapolation shows a mismatch (confirmed before
+    flagging). Sensor and centrality values are injected, not polled, so a
+    mismatch on those is reported without a fetch.
+    """
+
+    def __init__(self, client=None, accel_noise=0.2, uncertainty_bound=0.05, max_poll_interval=1.0,
+                 mismatch_bound=0.1, min_accel_dt=0.05, clock=time.monotonic):
+        super().__init__(client)
+        self.accel_noise = accel_noise              # unmodelled acceleration (m/s^2)
+        self.uncertainty_bound = uncertainty_bound  # max tolerated speed uncertainty (m/s)
+        self.max_poll_interval = max_poll_interval  # seconds
+        self.mismatch_bound = mismatch_bound
+        self.min_accel_dt = min_accel_dt            # seconds; closer polls keep the previous acceleration
+        self.clock = clock
+
+        self.models = {}
+        self.sensor_ok = {}
+        self.centrality = {}
+        self.polls = 0
+        self.checks = 0
+
+    def set_sensor_status(self, drone_id, sensor_ok):
+        self.sensor_ok[drone_id] = sensor_ok
+
+    def set_centrality(self, drone_id, centrality):
+        self.centrality[drone_id] = centrality
+
+    def poll(self, drone_id):
+        """
+        Fetches the real state and updates the kinematic model.
+        Acceleration is estimated from the change in velocity since the previous poll;
+        polls closer together than min_accel_dt keep the previous estimate, since
+        dividing velocity noise by a tiny dt would blow it up.
+        """
+        now = self.clock()
+        state = self.client.getMultirotorState(vehicle_name=drone_id)
+        kinematics = state.kinematics_estimated
+        position = (kinematics.position.x_val, kinematics.position.y_val, kinematics.position.z_val)
+        velocity = (kinematics.linear_velocity.x_val, kinematics.linear_velocity.y_val,
+                    kinematics.linear_velocity.z_val)
+
+        accel = (0.0, 0.0, 0.0)
+        previous = self.models.get(drone_id)
+        if previous is not None:
+            dt = now - previous['t']
+            if dt >= self.min_accel_dt:
+                accel = tuple((v - pv) / dt for v, pv in zip(velocity, previous['velocity']))
+            else:
+                accel = previous['accel']
+
+        self.models[drone_id] = {'t': now, 'position': position, 'velocity': velocity, 'accel': accel}
+        self.polls += 1
+        return self.models[drone_id]
+
+    def predict(self, drone_id, t=None):
+        """
+        Extrapolates the model to time t (default: now) with constant acceleration.
+        Returns position, velocity, speed and the speed uncertainty of the extrapolation.
+        """
+        model = self.models[drone_id]
+        dt = max(0.0, (self.clock() if t is None else t) - model['t'])
+        velocity = tuple(v + a * dt for v, a in zip(model['velocity'], model['accel']))
+        position = tuple(p + v * dt + 0.5 * a * dt ** 2
+                         for p, v, a in zip(model['position'], model['velocity'], model['accel']))
+        speed = sum(v ** 2 for v in velocity) ** 0.5
+        return {
+            'position': position,
+            'velocity': velocity,
+            'speed': speed,
+            'uncertainty': self.accel_noise * dt,
+            'age': dt
+        }
+
+    def _needs_poll(self, drone_id):
+        if drone_id not in self.models:
+            return True
+        prediction = self.predict(drone_id)
+        return prediction['uncertainty'] > self.uncertainty_bound or prediction['age'] > self.max_poll_interval
+
+    def get_actual_metrics(self, drone_id, force_poll=False):
+        """
+        Same dictionary as DigitalTwinPlugin.get_actual_metrics, served from the
+        kinematic model unless a poll is due (or forced).
+        """
+        if force_poll or self._needs_poll(drone_id):
+            self.poll(drone_id)
+        prediction = self.predict(drone_id)
+
+        return {
+            'speed': round(prediction['speed'], 2),
+            'sensor_ok': self.sensor_ok.get(drone_id, 1),
+            'centrality': self.centrality.get(drone_id, 0.75)
+        }
+
+    def verify_communication(self, sender_id, receiver_id, predicted_data):
+        """
+        Verifies a drone's self-reported state against the extrapolated twin.
+        A speed mismatch against the model is re-checked with a real fetch before
+        the drone is reported as malicious.
+        """
+        self.checks += 1
+        polls_before = self.polls
+        actual = self.get_actual_metrics(sender_id)
+        delta = self.verify_drone(predicted_data, actual)
+
+        if delta['speed'] >= self.mismatch_bound and self.polls == polls_before:
+            actual = self.get_actual_metrics(sender_id, force_poll=True)
+            delta = self.verify_drone(predicted_data, actual)
+
+        is_trustworthy = all(v < self.mismatch_bound for v in delta.values())
+
+        print(f"[TRUST CHECK] {receiver_id} verified {sender_id}: "
+              f"ΔSpeed={delta['speed']:.2f}, ΔCentrality={delta['centrality']:.2f}, ΔSensor={delta['sensor']} "
+              f"=> {'TRUSTED ✅' if is_trustworthy else 'MALICIOUS ⚠️'}")
+
+        return delta, is_trustworthy
+
+    def polling_stats(self):
+        """Checks served vs. real fetches issued, to quantify the RPC savings."""
+        return {
+            'checks': self.checks,
+            'polls': self.polls,
+            'polls_per_check': self.polls / self.checks if self.checks else 0.0
+        }
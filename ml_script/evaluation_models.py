@@ -0,0 +1,72 @@
+"""
+Shared model definitions for the F1/R2 evaluation tables and tuning tools.
+
+Defaults reproduce the hard-coded notebook settings of the F1 table; the
+per-table differences (the R2 table trains the CNN for 50 epochs, the F1
+table uses a sigmoid output) live in TABLE_KWARGS.  Every hyperparameter is
+exposed as a keyword so the search tools can vary it.  TensorFlow is imported
+lazily so RF/SVR-only runs (and worker processes) do not pay for it.
+"""
+import os
+
+import numpy as np
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.svm import SVR
+
+
+def model_rf(X_train, y_train, X_all, n_estimators=100, max_depth=None, min_samples_leaf=1,
+             max_features=1.0, random_state=42):
+    model = RandomForestRegressor(n_estimators=n_estimators, max_depth=max_depth,
+                                  min_samples_leaf=min_samples_leaf, max_features=max_features,
+                                  random_state=random_state)
+    model.fit(X_train, y_train)
+    return model.predict(X_all)
+
+
+def model_svm(X_train, y_train, X_all, C=100, epsilon=0.0005, gamma='scale'):
+    model = SVR(kernel='rbf', C=C, epsilon=epsilon, gamma=gamma)
+    model.fit(X_train, y_train)
+    return model.predict(X_all)
+
+
+def build_cnn(n_features, filters=64, dense_units=64, learning_rate=0.001, output_activation=None):
+    """Evaluation-table CNN: two Conv1D layers, a dense head and a single output."""
+    os.environ.setdefault("TF_CPP_MIN_LOG_LEVEL", "2")
+    from tensorflow.keras.models import Sequential
+    from tensorflow.keras.layers import Input, Conv1D, Flatten, Dense
+    from tensorflow.keras.optimizers import Adam
+
+    model = Sequential([
+        Input(shape=(n_features, 1)),
+        Conv1D(filters, kernel_size=2, activation='relu'),
+        Conv1D(filters // 2, kernel_size=2, activation='relu'),
+        Flatten(),
+        Dense(dense_units, activation='relu'),
+        Dense(1, activation=output_activation)
+    ])
+    model.compile(optimizer=Adam(learning_rate), loss='mse')
+    return model
+
+
+def model_cnn(X_train, y_train, X_all, epochs=30, batch_size=8, filters=64, dense_units=64,
+              learning_rate=0.001, output_activation=None):
+    """Accepts 2-D or already reshaped 3-D feature matrices."""
+    X_train = np.asarray(X_train).reshape((len(X_train), -1, 1))
+    X_all = np.asarray(X_all).reshape((len(X_all), -1, 1))
+    model = build_cnn(X_train.shape[1], filters, dense_units, learning_rate, output_activation)
+    model.fit(X_train, np.asarray(y_train), epochs=epochs, batch_size=batch_size, verbose=0)
+    return model.predict(X_all, verbose=0).flatten()
+
+
+MODELS = {
+    "Random Forest": model_rf,
+    "SVM (SVR)": model_svm,
+    "CNN": model_cnn
+}
+
+# Per-model overrides of the defaults used by R2_Evaluation_Table and
+# F1_Evaluvtion_Table / confusion_matrix_analysis
+TABLE_KWARGS = {
+    "R2": {"CNN": {"epochs": 50}},
+    "F1": {"CNN": {"epochs": 30, "output_activation": "sigmoid"}}
+}
@@ -0,0 +1,202 @@
+"""
+Parallel successive-halving hyperparameter search for the RF, SVR and CNN models.
+
+Every (attack, model) pair gets its own bracket: many configurations are
+scored on a cheap budget, the best 1/eta are promoted to an eta-times larger
+budget, and so on until one configuration remains at the full budget.  All
+brackets advance rung by rung in lockstep on one process pool, so the four
+attack datasets are tuned concurrently.
+
+Fold splits and the per-fold MinMax-scaled matrices are computed once in the
+parent and shipped to each worker a single time through the pool initializer.
+Each bracket starts from eta**(rungs-1) configurations sampled from its grid;
+the sample size is printed and reported next to the best configuration.
+
+Budgets:
+    Random Forest -> n_estimators
+    SVM (SVR)     -> fraction of the training fold used for fitting
+    CNN           -> epochs
+
+Usage:
+    python hyperparam_search.py
+"""
+import itertools
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import r2_score
+from sklearn.model_selection import KFold
+from sklearn.preprocessing import MinMaxScaler
+from threadpoolctl import threadpool_limits
+
+from evaluation_models import model_rf, model_svm, model_cnn
+from telemetry_store import RESULT_DIR, TelemetryStore, load_attack_xy
+
+ATTACKS = ["Critical Node", "Data Manipulation", "MITM Attack", "Sybil Attack"]
+
+# === Search Spaces ===
+SEARCH_SPACES = {
+    "Random Forest": {
+        "params": {
+            "max_depth": [None, 4, 8, 16],
+            "min_samples_leaf": [1, 2, 4],
+            "max_features": [1.0, 0.5, "sqrt"]
+        },
+        "resource": "n_estimators", "min_resource": 10, "max_resource": 270
+    },
+    "SVM (SVR)": {
+        "params": {
+            "C": [1, 10, 100, 1000],
+            "epsilon": [0.0005, 0.005, 0.05],
+            "gamma": ["scale", 0.1, 1.0, 10.0]
+        },
+        "resource": "train_fraction", "min_resource": 1 / 9, "max_resource": 1.0
+    },
+    "CNN": {
+        "params": {
+            "filters": [32, 64],
+            "dense_units": [32, 64],
+            "learning_rate": [0.001, 0.003],
+            "batch_size": [8, 16, 32]
+        },
+        "resource": "epochs", "min_resource": 8, "max_resource": 200
+    }
+}
+
+# === Worker State (filled once per process by the pool initializer) ===
+_FOLDS = {}
+
+
+def make_folds(X, y, n_splits=5, seed=42):
+    """
+    Returns [(X_train_scaled, y_train, X_val_scaled, y_val), ...] for one dataset.
+    Training rows are shuffled once, so the SVR train_fraction budget takes a
+    random subset rather than the earliest iterations.
+    """
+    rng = np.random.default_rng(seed)
+    folds = []
+    for train_idx, val_idx in KFold(n_splits=n_splits, shuffle=True, random_state=seed).split(X):
+        train_idx = rng.permutation(train_idx)
+        scaler = MinMaxScaler()
+        X_train = scaler.fit_transform(X[train_idx])
+        X_val = scaler.transform(X[val_idx])
+        folds.append((X_train, y[train_idx], X_val, y[val_idx]))
+    return folds
+
+
+def _init_worker(folds):
+    global _FOLDS
+    _FOLDS = folds
+    # One thread per worker; the pool provides the parallelism.  NumPy/sklearn are
+    # already loaded here, so their thread pools are limited at runtime; TensorFlow
+    # is imported lazily and still reads the environment.
+    threadpool_limits(1)
+    os.environ["TF_NUM_INTRAOP_THREADS"] = "1"
+    os.environ["TF_NUM_INTEROP_THREADS"] = "1"
+
+
+def _run_trial(attack, model_name, params, resource):
+    """Scores one configuration on one budget: mean validation R2 across the cached folds."""
+    scores = []
+    for X_train, y_train, X_val, y_val in _FOLDS[attack]:
+        if model_name == "Random Forest":
+            preds = model_rf(X_train, y_train, X_val, n_estimators=int(resource), **params)
+        elif model_name == "SVM (SVR)":
+            n = max(2, int(round(len(X_train) * resource)))
+            preds = model_svm(X_train[:n], y_train[:n], X_val, **params)
+        else:
+            preds = model_cnn(X_train, y_train, X_val, epochs=int(resource), **params)
+        scores.append(r2_score(y_val, preds))
+    return float(np.mean(scores))
+
+
+class Bracket:
+    """Successive-halving state for one (attack, model) pair."""
+
+    def __init__(self, attack, model_name, space, eta=3, seed=42):
+        self.attack = attack
+        self.model_name = model_name
+        self.space = space
+        self.eta = eta
+
+        ratio = space["max_resource"] / space["min_resource"]
+        self.n_rungs = int(round(np.log(ratio) / np.log(eta))) + 1
+
+        grid = [dict(zip(space["params"], values)) for values in itertools.product(*space["params"].values())]
+        self.grid_size = len(grid)
+        n_configs = min(len(grid), eta ** (self.n_rungs - 1))
+        self.survivors = random.Random(seed).sample(grid, n_configs)
+        self.rung = 0
+        self.history = []
+
+    @property
+    def done(self):
+        return self.rung >= self.n_rungs
+
+    def resource(self):
+        r = self.space["max_resource"] * self.eta ** (self.rung - self.n_rungs + 1)
+        return r if self.space["resource"] == "train_fraction" else int(round(r))
+
+    def promote(self, scores):
+        """Records this rung's scores and keeps the top 1/eta configurations."""
+        resource = self.resource()
+        for params, score in zip(self.survivors, scores):
+            self.history.append({
+                "Attack": self.attack, "Model": self.model_name, "Rung": self.rung,
+                "Budget": f"{self.space['resource']}={resource:g}", "Params": params, "R2": score
+            })
+        ranked = sorted(zip(scores, range(len(scores))), key=lambda t: -t[0])
+        keep = max(1, len(self.survivors) // self.eta)
+        self.survivors = [self.survivors[i] for _, i in ranked[:keep]]
+        self.rung += 1
+
+
+def search(store, attacks=ATTACKS, models=tuple(SEARCH_SPACES), n_jobs=None, eta=3, n_splits=5, seed=42):
+    """
+    Runs successive halving for every (attack, model) pair on a shared process pool.
+    Returns (best_df, trials_df).
+    """
+    folds = {attack: make_folds(*load_attack_xy(store, attack), n_splits=n_splits, seed=seed) for attack in attacks}
+    brackets = [Bracket(a, m, SEARCH_SPACES[m], eta, seed) for a in attacks for m in models]
+    for b in brackets[:len(models)]:
+        print(f"[INFO] {b.model_name}: sampling {len(b.survivors)} of {b.grid_size} grid configurations, "
+              f"{b.n_rungs} rungs")
+
+    start = time.time()
+    with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker, initargs=(folds,)) as pool:
+        while any(not b.done for b in brackets):
+            active = [b for b in brackets if not b.done]
+            futures = {
+                b: [pool.submit(_run_trial, b.attack, b.model_name, params, b.resource()) for params in b.survivors]
+                for b in active
+            }
+            for b, fs in futures.items():
+                b.promote([f.result() for f in fs])
+            print(f"[INFO] Rung complete: {sum(len(fs) for fs in futures.values())} trials "
+                  f"({time.time() - start:.1f}s elapsed)")
+
+    trials_df = pd.DataFrame([row for b in brackets for row in b.history])
+    best = []
+    for b in brackets:
+        final = [row for row in b.history if row["Rung"] == b.n_rungs - 1][0]
+        best.append({
+            "Attack": b.attack, "Model": b.model_name,
+            "Best Params": final["Params"], "Budget": final["Budget"],
+            "Configs Sampled": f"{sum(row['Rung'] == 0 for row in b.history)}/{b.grid_size}",
+            "CV R2": round(final["R2"], 4)
+        })
+    return pd.DataFrame(best), trials_df
+
+
+if __name__ == "__main__":
+    store = TelemetryStore.open()
+    best_df, trials_df = search(store)
+    print(best_df.to_string(index=False))
+
+    save_path = os.path.join(RESULT_DIR, "hyperparam_search_trials.csv")
+    trials_df.to_csv(save_path, index=False)
+    print(f" Trial log saved to: {save_path}")
@@ -0,0 +1,141 @@
+"""
+Fixed-tick pipelined scheduler for the simulation loops.
+
+The simulation scripts run every iteration strictly serially (graph ->
+centrality -> telemetry -> CSV -> plot -> sleep).  TickPipeline splits an
+iteration into stages, each running in its own thread and connected to the
+next by a bounded queue.  A source thread emits ticks on a fixed schedule;
+while stage k works on tick t, stage k-1 already works on tick t+1, so the
+tick rate is limited by the slowest stage instead of the sum of all stages.
+
+Full queues block the upstream stage (backpressure).  With
+drop_late_ticks=True the source skips a tick instead of blocking, keeping
+the wall-clock schedule when a downstream stage falls behind.
+
+Threads suit these stages: AirSim RPCs and file writes release the GIL.
+The last stage's output is yielded to the caller's thread, which is where
+Tk-based matplotlib rendering has to happen.
+
+Usage:
+    pipeline = TickPipeline([Stage("telemetry", fetch), Stage("log", write)], tick_interval=0.5)
+    for frame in pipeline.run(15):
+        plot(frame)
+"""
+import queue
+import threading
+import time
+
+_STOP = object()
+_POLL_SECONDS = 0.05
+
+
+def _put(q, item, stop_event):
+    """Blocking put that gives up once the pipeline is being torn down."""
+    while not stop_event.is_set():
+        try:
+            q.put(item, timeout=_POLL_SECONDS)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def _get(q, stop_event):
+    while not stop_event.is_set():
+        try:
+            return q.get(timeout=_POLL_SECONDS)
+        except queue.Empty:
+            pass
+    return _STOP
+
+
+class _Failure:
+    def __init__(self, stage, exc):
+        self.stage = stage
+        self.exc = exc
+
+
+class Stage:
+    def __init__(self, name, fn):
+        self.name = name
+        self.fn = fn
+        self.processed = 0
+        self.busy_seconds = 0.0
+
+    def _loop(self, inbox, outbox, stop_event):
+        while True:
+            item = _get(inbox, stop_event)
+            if item is _STOP or isinstance(item, _Failure):
+                _put(outbox, item, stop_event)
+                return
+            start = time.perf_counter()
+            try:
+                result = self.fn(item)
+            except Exception as exc:
+                _put(outbox, _Failure(self.name, exc), stop_event)
+                return
+            self.busy_seconds += time.perf_counter() - start
+            self.processed += 1
+            if not _put(outbox, result, stop_event):
+                return
+
+
+class TickPipeline:
+    def __init__(self, stages, tick_interval=0.5, queue_size=2, drop_late_ticks=False):
+        self.stages = stages
+        self.tick_interval = tick_interval
+        self.queue_size = queue_size
+        self.drop_late_ticks = drop_late_ticks
+        self.dropped_ticks = 0
+
+    def _source(self, n_ticks, outbox, stop_event):
+        start = time.monotonic()
+        for tick in range(n_ticks):
+            if stop_event.is_set():
+                break
+            delay = start + tick * self.tick_interval - time.monotonic()
+            if delay > 0 and stop_event.wait(delay):
+                break
+            if self.drop_late_ticks:
+                try:
+                    outbox.put_nowait(tick)
+                except queue.Full:
+                    self.dropped_ticks += 1
+            elif not _put(outbox, tick, stop_event):
+                return
+        _put(outbox, _STOP, stop_event)
+
+    def run(self, n_ticks):
+        """Starts the pipeline and yields each tick's final result in order."""
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in range(len(self.stages) + 1)]
+        stop_event = threading.Event()
+        threads = [threading.Thread(target=self._source, args=(n_ticks, queues[0], stop_event), daemon=True)]
+        for i, stage in enumerate(self.stages):
+            threads.append(threading.Thread(target=stage._loop, args=(queues[i], queues[i + 1], stop_event),
+                                            name=f"stage-{stage.name}", daemon=True))
+        for t in threads:
+            t.start()
+
+        try:
+            while True:
+                item = queues[-1].get()
+                if item is _STOP:
+                    break
+                if isinstance(item, _Failure):
+                    raise RuntimeError(f"Pipeline stage '{item.stage}' failed") from item.exc
+                yield item
+        finally:
+            # Normal end: every thread already passed the stop marker; early exit: tear down
+            stop_event.set()
+            for t in threads:
+                t.join()
+
+    def stats(self):
+        """Per-stage busy time; the largest mean is the pipeline's tick-rate limit."""
+        return {
+            stage.name: {
+                'processed': stage.processed,
+                'mean_seconds': stage.busy_seconds / stage.processed if stage.processed else 0.0
+            }
+            for stage in self.stages
+        }
@@ -0,0 +1,155 @@
+"""
+Precomputed RBF kernel reuse for SVR sweeps and cross-validation.
+
+The squared-distance matrix of the scaled dataset is computed once.  In a
+sweep the train x train and val x train kernel blocks are derived from it
+once per (gamma, fold) and shared by every C / epsilon fit, which then only
+runs libsvm's solver on a precomputed kernel.  Predictions are identical to
+the notebook SVR.
+
+Most of a sweep's time is spent in the solver itself, so the gain over
+plain SVR(kernel='rbf') is modest; __main__ times both sweeps side by side.
+
+Usage:
+    python svr_kernel_cache.py
+"""
+import itertools
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import r2_score
+from sklearn.model_selection import KFold, train_test_split
+from sklearn.preprocessing import MinMaxScaler
+from sklearn.svm import SVR
+
+from telemetry_store import TelemetryStore, load_attack_xy
+
+
+class RBFKernelCache:
+    def __init__(self, X, max_kernels=16):
+        self.X = np.asarray(X, dtype=np.float64)
+        sq = np.einsum("ij,ij->i", self.X, self.X)
+        dist = sq[:, None] + sq[None, :] - 2.0 * (self.X @ self.X.T)
+        np.maximum(dist, 0.0, out=dist)
+        np.fill_diagonal(dist, 0.0)
+        self.sq_dist = dist
+        self.max_kernels = max_kernels
+        self._kernels = OrderedDict()
+
+    def gamma_scale(self, train_idx):
+        """Same value SVR(gamma='scale') derives from the training rows."""
+        X_train = self.X[train_idx]
+        var = X_train.var()
+        return 1.0 / (X_train.shape[1] * var) if var != 0 else 1.0
+
+    def kernel(self, gamma):
+        """Full n x n RBF kernel for one gamma, kept in a small LRU cache."""
+        key = float(gamma)
+        if key in self._kernels:
+            self._kernels.move_to_end(key)
+            return self._kernels[key]
+        K = np.exp(-key * self.sq_dist)
+        self._kernels[key] = K
+        if len(self._kernels) > self.max_kernels:
+            self._kernels.popitem(last=False)
+        return K
+
+    def fit(self, train_idx, y_train, C=100, epsilon=0.0005, gamma='scale'):
+        """Fits an SVR on the training rows; returns (model, gamma) for predict()."""
+        if gamma == 'scale':
+            gamma = self.gamma_scale(train_idx)
+        K = self.kernel(gamma)
+        model = SVR(kernel='precomputed', C=C, epsilon=epsilon)
+        model.fit(K[np.ix_(train_idx, train_idx)], y_train)
+        return model, gamma
+
+    def predict(self, model, gamma, train_idx, predict_idx):
+        return model.predict(self.kernel(gamma)[np.ix_(predict_idx, train_idx)])
+
+    def fit_predict(self, train_idx, y_train, predict_idx=None, C=100, epsilon=0.0005, gamma='scale'):
+        """Drop-in for model_svm(X[train_idx], y_train, X[predict_idx]); predicts all rows by default."""
+        train_idx = np.asarray(train_idx)
+        if predict_idx is None:
+            predict_idx = np.arange(len(self.X))
+        model, gamma = self.fit(train_idx, y_train, C, epsilon, gamma)
+        return self.predict(model, gamma, train_idx, predict_idx)
+
+
+def _splits(X, splits):
+    if splits is None:
+        splits = KFold(n_splits=5, shuffle=True, random_state=42).split(X)
+    return list(splits)
+
+
+def svr_sweep(cache, y, Cs, epsilons, gammas=('scale',), splits=None):
+    """
+    Cross-validated R2 for every C / epsilon / gamma combination, all sharing one distance matrix.
+    splits: iterable of (train_idx, val_idx); defaults to shuffled 5-fold.
+    """
+    y = np.asarray(y)
+    splits = _splits(cache.X, splits)
+
+    rows = []
+    for fold, (train_idx, val_idx) in enumerate(splits):
+        # Distance blocks are sliced once per fold, kernel blocks once per (gamma, fold)
+        d_train = cache.sq_dist[np.ix_(train_idx, train_idx)]
+        d_val = cache.sq_dist[np.ix_(val_idx, train_idx)]
+        for gamma in gammas:
+            g = cache.gamma_scale(train_idx) if gamma == 'scale' else gamma
+            K_train = np.exp(-g * d_train)
+            K_val = np.exp(-g * d_val)
+            for C, epsilon in itertools.product(Cs, epsilons):
+                model = SVR(kernel='precomputed', C=C, epsilon=epsilon).fit(K_train, y[train_idx])
+                rows.append({"gamma": gamma, "C": C, "epsilon": epsilon, "Fold": fold,
+                             "R2": r2_score(y[val_idx], model.predict(K_val))})
+    return pd.DataFrame(rows)
+
+
+def plain_svr_sweep(X, y, Cs, epsilons, gammas=('scale',), splits=None):
+    """Reference sweep with SVR(kernel='rbf'), for timing and checking svr_sweep()."""
+    y = np.asarray(y)
+    splits = _splits(X, splits)
+
+    rows = []
+    for fold, (train_idx, val_idx) in enumerate(splits):
+        for gamma, C, epsilon in itertools.product(gammas, Cs, epsilons):
+            model = SVR(kernel='rbf', C=C, epsilon=epsilon, gamma=gamma).fit(X[train_idx], y[train_idx])
+            rows.append({"gamma": gamma, "C": C, "epsilon": epsilon, "Fold": fold,
+                         "R2": r2_score(y[val_idx], model.predict(X[val_idx]))})
+    return pd.DataFrame(rows)
+
+
+def table_split(n, test_size=0.2, random_state=42):
+    """Row indices of the notebooks' train_test_split(test_size=0.2, random_state=42)."""
+    return train_test_split(np.arange(n), test_size=test_size, random_state=random_state)
+
+
+if __name__ == "__main__":
+    store = TelemetryStore.open()
+    Cs = [1, 10, 100, 1000]
+    epsilons = [0.0005, 0.005, 0.05]
+    gammas = ['scale', 0.1, 1.0, 10.0]
+
+    for attack in ["Critical Node", "Data Manipulation", "MITM Attack", "Sybil Attack"]:
+        X, y = load_attack_xy(store, attack)
+        X_scaled = MinMaxScaler().fit_transform(X)
+
+        start = time.perf_counter()
+        cache = RBFKernelCache(X_scaled)
+        results = svr_sweep(cache, y, Cs, epsilons, gammas)
+        cached_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        reference = plain_svr_sweep(X_scaled, y, Cs, epsilons, gammas)
+        plain_seconds = time.perf_counter() - start
+        max_diff = np.abs(results["R2"].to_numpy() - reference["R2"].to_numpy()).max()
+
+        gamma, C, epsilon = results.groupby(["gamma", "C", "epsilon"])["R2"].mean().idxmax()
+        train_idx, _ = table_split(len(y))
+        table_preds = cache.fit_predict(train_idx, y[train_idx])
+        print(f"[INFO] {attack}: {len(results)} fits, cached {cached_seconds:.2f}s vs plain SVR {plain_seconds:.2f}s "
+              f"(speedup {plain_seconds / cached_seconds:.2f}x, max R2 diff {max_diff:.1e})")
+        print(f"       best gamma={gamma}, C={C:g}, epsilon={epsilon:g}, "
+              f"table SVR R2 = {r2_score(y, table_preds):.4f}")
@@ -0,0 +1,378 @@
+"""
+Shared-directory job queue for attack x swarm size x seed x model sweeps.
+
+The coordinator expands the scenario grid into one JSON file per job under a
+directory every host can see (local disk or an NFS/SMB share):
+
+    <queue>/jobs/<job_id>.json       job description (written once)
+    <queue>/leases/<job_id>.lease    claimed by a worker (O_CREAT | O_EXCL)
+    <queue>/results/<job_id>.json    finished (written with os.replace)
+    <queue>/failed/<job_id>.json     traceback and attempt count of failed runs
+
+Workers claim a job by creating its lease file exclusively (the file records
+the owner's worker id), keep the lease alive by touching it while the job
+runs, and write the result to a temp file that is renamed into place, so a
+result is either complete or absent.  A lease whose mtime is older than
+lease_seconds belongs to a dead worker and is taken over; a worker that only
+stalled notices the new owner, stops renewing, discards its result and never
+deletes a lease it does not own.  Lease ages are measured against the share's
+own clock (the mtime of a freshly touched probe file), so clock skew between
+hosts does not matter.  A failed job is retried until it has failed
+max_attempts times.  Restarting init, any worker or the whole sweep only
+re-runs jobs without a result.
+
+Each job runs the headless SwarmSimulation into a TelemetryBuffer and fits one
+evaluation model (see telemetry_shm.py).
+
+Usage (PYTHONPATH=../attacks):
+    python sweep_queue.py init   --queue /shared/sweep
+    python sweep_queue.py worker --queue /shared/sweep      # on every host, any number of times
+    python sweep_queue.py status --queue /shared/sweep
+    python sweep_queue.py worker --queue /shared/sweep --retry-failed   # reset attempt counts first
+    python sweep_queue.py local  --queue /tmp/sweep --workers 4   # init + 4 worker processes
+"""
+import argparse
+import glob
+import itertools
+import json
+import multiprocessing
+import os
+import socket
+import threading
+import time
+import traceback
+import uuid
+
+import pandas as pd
+
+from telemetry_store import DATA_DIR, RESULT_DIR
+
+DEFAULT_QUEUE_DIR = os.path.join(DATA_DIR, "sweep_queue")
+LEASE_SECONDS = 60
+MAX_ATTEMPTS = 3
+POLL_SECONDS = 2.0
+
+# === Scenario Grid ===
+GRID = {
+    "attack": ["critical_node", "data_manipulation", "mitm", "sybil"],
+    "n_drones": [9, 18, 36],
+    "seed": [1, 2, 3],
+    "model": ["Random Forest", "SVM (SVR)"]
+}
+N_ITERATIONS = 30
+
+
+def job_id(job):
+    model = job["model"].lower().replace(" ", "_").replace("(", "").replace(")", "")
+    return f"{job['attack']}-n{job['n_drones']}-s{job['seed']}-{model}"
+
+
+def expand_grid(grid=GRID, n_iterations=N_ITERATIONS):
+    keys = list(grid)
+    jobs = [dict(zip(keys, values), n_iterations=n_iterations) for values in itertools.product(*grid.values())]
+    for job in jobs:
+        job["id"] = job_id(job)
+    return jobs
+
+
+# === Queue Layout ===
+def _path(queue_dir, kind, jid):
+    suffix = ".lease" if kind == "leases" else ".json"
+    return os.path.join(queue_dir, kind, jid + suffix)
+
+
+def _write_atomic(path, payload):
+    tmp = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(payload, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def init_queue(queue_dir=DEFAULT_QUEUE_DIR, jobs=None):
+    """Writes job files that do not exist yet; returns the number of new jobs."""
+    for kind in ("jobs", "leases", "results", "failed"):
+        os.makedirs(os.path.join(queue_dir, kind), exist_ok=True)
+    created = 0
+    for job in jobs if jobs is not None else expand_grid():
+        path = _path(queue_dir, "jobs", job["id"])
+        if not os.path.exists(path):
+            _write_atomic(path, job)
+            created += 1
+    return created
+
+
+# === Leases ===
+def _probe_path(queue_dir):
+    return os.path.join(queue_dir, "leases", f".clock-{socket.gethostname()}-{os.getpid()}")
+
+
+def share_time(queue_dir):
+    """Current time on the share's clock: the mtime of a probe file touched just now."""
+    probe = _probe_path(queue_dir)
+    with open(probe, "a"):
+        os.utime(probe)
+    return os.stat(probe).st_mtime
+
+
+def _lease_age(path, now):
+    return now - os.stat(path).st_mtime
+
+
+def try_lease(queue_dir, jid, worker_id, lease_seconds=LEASE_SECONDS):
+    """Claims a job; returns True if this worker now holds its lease."""
+    path = _path(queue_dir, "leases", jid)
+    for _ in range(2):
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            now = share_time(queue_dir)
+            try:
+                if _lease_age(path, now) < lease_seconds:
+                    return False
+                # Stale lease: move it aside; only one worker's rename can succeed
+                tomb = f"{path}.{worker_id}.stale"
+                os.rename(path, tomb)
+            except FileNotFoundError:
+                continue
+            if _lease_age(tomb, now) < lease_seconds:
+                # Lost a race and moved a fresh lease: put it back unless someone re-claimed meanwhile
+                try:
+                    os.link(tomb, path)
+                except FileExistsError:
+                    pass
+                os.unlink(tomb)
+                return False
+            os.unlink(tomb)
+            continue
+        with os.fdopen(fd, "w") as f:
+            json.dump({"worker": worker_id, "host": socket.gethostname(), "claimed": time.time()}, f)
+        return True
+    return False
+
+
+def lease_owner(path):
+    """worker_id recorded in a lease file, or None if it is missing or not written yet."""
+    try:
+        with open(path) as f:
+            return json.load(f).get("worker")
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def release_lease(queue_dir, jid, worker_id):
+    """Deletes the lease only if this worker still owns it; returns True if it did."""
+    path = _path(queue_dir, "leases", jid)
+    if lease_owner(path) != worker_id:
+        return False
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def _heartbeat(path, worker_id, stop_event, lost_event, interval):
+    """Renews the lease while this worker owns it; sets lost_event once it was taken over."""
+    while not stop_event.wait(interval):
+        if lease_owner(path) != worker_id:
+            lost_event.set()
+            return
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            lost_event.set()
+            return
+
+
+# === Worker ===
+def run_job(job):
+    """Headless simulation + one evaluation model; returns the result record."""
+    from telemetry_shm import evaluate, simulate
+
+    start = time.time()
+    buffer = simulate(job["attack"], job["n_iterations"], n_drones=job["n_drones"], seed=job["seed"])
+    sim_seconds = time.time() - start
+    r2 = evaluate(buffer, job["model"])
+    return {
+        **job,
+        "rows": len(buffer),
+        "attacked_rows": int(buffer.columns(["Attacked"])["Attacked"].sum()),
+        "r2": r2,
+        "sim_seconds": sim_seconds,
+        "total_seconds": time.time() - start
+    }
+
+
+def _attempts(queue_dir, jid):
+    try:
+        with open(_path(queue_dir, "failed", jid)) as f:
+            return json.load(f).get("attempts", 1)
+    except FileNotFoundError:
+        return 0
+
+
+def _pending(queue_dir, max_attempts=MAX_ATTEMPTS):
+    done = {os.path.basename(p)[:-5] for p in glob.glob(os.path.join(queue_dir, "results", "*.json"))}
+    failed = {os.path.basename(p)[:-5] for p in glob.glob(os.path.join(queue_dir, "failed", "*.json"))}
+    jobs = sorted(os.path.basename(p)[:-5] for p in glob.glob(os.path.join(queue_dir, "jobs", "*.json")))
+    return [j for j in jobs if j not in done and (j not in failed or _attempts(queue_dir, j) < max_attempts)]
+
+
+def retry_failed(queue_dir=DEFAULT_QUEUE_DIR):
+    """Resets the attempt count of every failed job; returns how many were reset."""
+    paths = glob.glob(os.path.join(queue_dir, "failed", "*.json"))
+    for path in paths:
+        os.unlink(path)
+    return len(paths)
+
+
+def worker(queue_dir=DEFAULT_QUEUE_DIR, lease_seconds=LEASE_SECONDS, max_jobs=None, wait=True,
+           max_attempts=MAX_ATTEMPTS):
+    """
+    Claims and runs jobs until none are left.  With wait=True the worker also
+    waits for jobs leased by others, so it can take them over if their worker dies.
+    Jobs are retried until they have failed max_attempts times.
+    """
+    worker_id = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+    completed = 0
+    while max_jobs is None or completed < max_jobs:
+        pending = _pending(queue_dir, max_attempts)
+        if not pending:
+            break
+
+        claimed = None
+        for jid in pending:
+            if try_lease(queue_dir, jid, worker_id, lease_seconds):
+                # Another worker may have finished it between listing and claiming
+                if os.path.exists(_path(queue_dir, "results", jid)):
+                    release_lease(queue_dir, jid, worker_id)
+                    continue
+                claimed = jid
+                break
+        if claimed is None:
+            if not wait:
+                break
+            time.sleep(POLL_SECONDS)
+            continue
+
+        with open(_path(queue_dir, "jobs", claimed)) as f:
+            job = json.load(f)
+        lease_path = _path(queue_dir, "leases", claimed)
+        stop_event = threading.Event()
+        lost_event = threading.Event()
+        beat = threading.Thread(target=_heartbeat, daemon=True,
+                                args=(lease_path, worker_id, stop_event, lost_event, lease_seconds / 3))
+        beat.start()
+        try:
+            result = run_job(job)
+            if lost_event.is_set() or lease_owner(lease_path) != worker_id:
+                # Another worker took the job over while this one stalled; its run owns the result
+                print(f"⚠️ {worker_id}: lease on {claimed} lost, result discarded")
+                continue
+            result["worker"] = worker_id
+            _write_atomic(_path(queue_dir, "results", claimed), result)
+            try:
+                os.unlink(_path(queue_dir, "failed", claimed))
+            except FileNotFoundError:
+                pass
+            print(f"[INFO] {worker_id}: {claimed} R2={result['r2']:.4f} ({result['total_seconds']:.2f}s)")
+        except Exception:
+            if lost_event.is_set() or lease_owner(lease_path) != worker_id:
+                print(f"⚠️ {worker_id}: lease on {claimed} lost, failure not recorded")
+                continue
+            attempts = _attempts(queue_dir, claimed) + 1
+            _write_atomic(_path(queue_dir, "failed", claimed),
+                          {**job, "worker": worker_id, "attempts": attempts, "error": traceback.format_exc()})
+            print(f"⚠️ {worker_id}: {claimed} failed (attempt {attempts}/{max_attempts})")
+        finally:
+            stop_event.set()
+            beat.join()
+            release_lease(queue_dir, claimed, worker_id)
+        completed += 1
+
+    try:
+        os.unlink(_probe_path(queue_dir))
+    except FileNotFoundError:
+        pass
+    return completed
+
+
+# === Coordinator ===
+def status(queue_dir=DEFAULT_QUEUE_DIR, lease_seconds=LEASE_SECONDS, max_attempts=MAX_ATTEMPTS):
+    def count(kind, pattern="*.json"):
+        return len(glob.glob(os.path.join(queue_dir, kind, pattern)))
+
+    failed = [os.path.basename(p)[:-5] for p in glob.glob(os.path.join(queue_dir, "failed", "*.json"))]
+    gave_up = sum(_attempts(queue_dir, jid) >= max_attempts for jid in failed)
+    leases = glob.glob(os.path.join(queue_dir, "leases", "*.lease"))
+    now = share_time(queue_dir) if leases else 0.0
+    stale = 0
+    for path in leases:
+        try:
+            stale += _lease_age(path, now) >= lease_seconds
+        except FileNotFoundError:
+            pass
+    return {
+        "jobs": count("jobs"),
+        "done": count("results"),
+        "failed": gave_up,
+        "retrying": len(failed) - gave_up,
+        "running": len(leases) - stale,
+        "stale leases": stale
+    }
+
+
+def collect(queue_dir=DEFAULT_QUEUE_DIR):
+    records = []
+    for path in sorted(glob.glob(os.path.join(queue_dir, "results", "*.json"))):
+        with open(path) as f:
+            records.append(json.load(f))
+    return pd.DataFrame(records)
+
+
+def run_local(queue_dir, n_workers, lease_seconds=LEASE_SECONDS, max_attempts=MAX_ATTEMPTS):
+    """Initializes the queue and runs n_workers worker processes on this machine."""
+    init_queue(queue_dir)
+    processes = [multiprocessing.Process(target=worker, args=(queue_dir, lease_seconds),
+                                         kwargs={"max_attempts": max_attempts}) for _ in range(n_workers)]
+    for p in processes:
+        p.start()
+    for p in processes:
+        p.join()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Shared-directory scenario sweep queue")
+    parser.add_argument("command", choices=["init", "worker", "status", "local"])
+    parser.add_argument("--queue", default=DEFAULT_QUEUE_DIR)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--lease-seconds", type=float, default=LEASE_SECONDS)
+    parser.add_argument("--max-jobs", type=int, default=None)
+    parser.add_argument("--max-attempts", type=int, default=MAX_ATTEMPTS)
+    parser.add_argument("--retry-failed", action="store_true", help="reset the attempt count of failed jobs")
+    args = parser.parse_args()
+
+    if args.retry_failed:
+        print(f"[INFO] Reset {retry_failed(args.queue)} failed jobs")
+
+    if args.command == "init":
+        print(f"[INFO] {init_queue(args.queue)} new jobs in {args.queue}")
+    elif args.command == "worker":
+        completed = worker(args.queue, args.lease_seconds, args.max_jobs, max_attempts=args.max_attempts)
+        print(f"[INFO] Worker finished {completed} jobs")
+    elif args.command == "local":
+        start = time.time()
+        run_local(args.queue, args.workers, args.lease_seconds, args.max_attempts)
+        print(f"[INFO] Local sweep with {args.workers} workers finished in {time.time() - start:.2f}s")
+
+    print(f"[INFO] Queue status: {status(args.queue, args.lease_seconds, args.max_attempts)}")
+    if args.command in ("status", "local"):
+        df = collect(args.queue)
+        if not df.empty:
+            save_path = os.path.join(RESULT_DIR, "sweep_results.csv")
+            df.to_csv(save_path, index=False)
+            summary = df.groupby(["attack", "model", "n_drones"])["r2"].mean().unstack()
+            print(summary.round(4).to_string())
+            print(f"\n✅ Sweep results saved to:\n{save_path}")
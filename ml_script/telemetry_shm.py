@@ -0,0 +1,182 @@
+"""
+In-process telemetry hand-off from the headless simulation to the models.
+
+SwarmSimulation.step() returns each iteration as column lists.  Instead of
+writing them to CSV and re-parsing the text in a notebook, TelemetryBuffer
+appends them straight into a preallocated column-major float64 block that
+uses the telemetry_store numeric schema.  columns() returns views into that
+block, so engineer_features() and the model matrix are built without any
+serialization.  The raw columns are never copied; the derived feature
+columns and the stacked model matrix X are new arrays.
+
+With shared=True the block lives in multiprocessing.shared_memory; other
+processes attach() to it by name and read the same pages (single writer,
+the row count is published only after a batch is fully written).
+
+Usage (PYTHONPATH=../attacks):
+    buffer = simulate("sybil", n_iterations=50)
+    X, y = buffer.xy()
+"""
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+from sklearn.metrics import r2_score
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import MinMaxScaler
+
+from evaluation_models import MODELS, TABLE_KWARGS
+from swarm_simulation import ATTACKS, SwarmSimulation
+from telemetry_store import FEATURES, NUMERIC_COLUMNS, TARGET, engineer_features
+
+# "Attacked" is 1 for drones the attack targeted, "Malicious" mirrors Trust Status
+BUFFER_COLUMNS = ["Iteration"] + NUMERIC_COLUMNS + ["Attacked", "Malicious"]
+_COLUMN_INDEX = {col: i for i, col in enumerate(BUFFER_COLUMNS)}
+_HEADER_BYTES = 16  # int64 row count + int64 capacity
+
+
+class TelemetryBuffer:
+    def __init__(self, capacity=1024, shared=False, _shm=None):
+        self.shared = shared or _shm is not None
+        self._shm = _shm
+        if self.shared:
+            if self._shm is None:
+                nbytes = _HEADER_BYTES + len(BUFFER_COLUMNS) * capacity * 8
+                self._shm = shared_memory.SharedMemory(create=True, size=nbytes)
+                np.ndarray(2, dtype=np.int64, buffer=self._shm.buf)[:] = (0, capacity)
+            self._header = np.ndarray(2, dtype=np.int64, buffer=self._shm.buf)
+            capacity = int(self._header[1])
+            self._data = np.ndarray((len(BUFFER_COLUMNS), capacity), dtype=np.float64,
+                                    buffer=self._shm.buf, offset=_HEADER_BYTES)
+        else:
+            self._header = np.array([0, capacity], dtype=np.int64)
+            self._data = np.empty((len(BUFFER_COLUMNS), capacity), dtype=np.float64)
+
+    @classmethod
+    def attach(cls, name):
+        """Maps an existing shared buffer created in another process."""
+        return cls(_shm=shared_memory.SharedMemory(name=name))
+
+    @property
+    def name(self):
+        return self._shm.name if self.shared else None
+
+    @property
+    def capacity(self):
+        return self._data.shape[1]
+
+    def __len__(self):
+        return int(self._header[0])
+
+    def _reserve(self, n_rows):
+        if n_rows <= self.capacity:
+            return
+        if self.shared:
+            raise BufferError(f"Shared telemetry buffer full ({self.capacity} rows)")
+        grown = np.empty((len(BUFFER_COLUMNS), max(n_rows, 2 * self.capacity)), dtype=np.float64)
+        grown[:, :len(self)] = self._data[:, :len(self)]
+        self._data = grown
+        self._header[1] = grown.shape[1]
+
+    def append(self, records):
+        """Writes one SwarmSimulation.step() result (dict of CSV_HEADER column lists)."""
+        start = len(self)
+        stop = start + len(records["Drone"])
+        self._reserve(stop)
+        data = self._data
+
+        for col, i in _COLUMN_INDEX.items():
+            if col in records:
+                data[i, start:stop] = records[col]
+        np.multiply(data[_COLUMN_INDEX["Communication Intensity"], start:stop],
+                    data[_COLUMN_INDEX["Communication Scale"], start:stop],
+                    out=data[_COLUMN_INDEX["Scale-Intensity Centrality"], start:stop])
+        data[_COLUMN_INDEX["Neighbor Count"], start:stop] = [len(c) for c in records["Connected To"]]
+        data[_COLUMN_INDEX["Attacked"], start:stop] = [a not in ("", "Trustworthy") for a in records["Attack Type"]]
+        data[_COLUMN_INDEX["Malicious"], start:stop] = [s == "MALICIOUS" for s in records["Trust Status"]]
+
+        # Publish the rows only once they are complete
+        self._header[0] = stop
+
+    def columns(self, names=None):
+        """Zero-copy views of the filled rows, keyed by column name."""
+        n = len(self)
+        return {col: self._data[_COLUMN_INDEX[col], :n] for col in names or BUFFER_COLUMNS}
+
+    def xy(self, features=FEATURES):
+        """
+        Notebook feature matrix X and target y (a view into the buffer).
+        engineer_features() allocates the derived columns (Battery Level Norm,
+        Scale-Intensity Centrality, Trust Score) and X is stacked into a new array.
+        """
+        cols = engineer_features(self.columns())
+        X = np.column_stack([cols[f] for f in features])
+        return X, cols[TARGET]
+
+    def close(self):
+        if self.shared:
+            self._header = self._data = None
+            self._shm.close()
+
+    def unlink(self):
+        """Frees the shared segment (creator only, after every reader closed)."""
+        if self.shared:
+            self._shm.unlink()
+
+
+# === Simulate and Evaluate ===
+def simulate(attack, n_iterations=50, n_drones=9, seed=42, buffer=None):
+    """Runs a headless SwarmSimulation and appends every iteration to the buffer."""
+    sim = SwarmSimulation(attack, n_drones=n_drones, seed=seed)
+    buffer = buffer if buffer is not None else TelemetryBuffer()
+    for _ in range(n_iterations):
+        buffer.append(sim.step())
+    return buffer
+
+
+def evaluate(buffer, model_name, test_size=0.2, random_state=42):
+    """Scales, splits and fits one evaluation model on the buffer; returns the held-out R2."""
+    X, y = buffer.xy()
+    X_scaled = MinMaxScaler().fit_transform(X)
+    X_train, X_test, y_train, y_test = train_test_split(X_scaled, y, test_size=test_size,
+                                                        random_state=random_state)
+    preds = MODELS[model_name](X_train, y_train, X_test, **TABLE_KWARGS["R2"].get(model_name, {}))
+    return r2_score(y_test, preds)
+
+
+def _evaluate_shared(name, model_name):
+    buffer = TelemetryBuffer.attach(name)
+    try:
+        return evaluate(buffer, model_name)
+    finally:
+        buffer.close()
+
+
+def simulate_and_evaluate(attacks=ATTACKS, models=("Random Forest", "SVM (SVR)"), n_iterations=50,
+                          n_drones=9, seed=42, max_workers=None):
+    """
+    One shared buffer per attack; the models are fitted in worker processes that
+    attach to the buffer by name instead of receiving pickled arrays.
+    Returns {(attack, model): R2}.
+    """
+    capacity = n_iterations * (n_drones + 2)  # room for the MITM/Sybil extra nodes
+    buffers = {attack: simulate(attack, n_iterations, n_drones, seed, TelemetryBuffer(capacity, shared=True))
+               for attack in attacks}
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = {(attack, model): pool.submit(_evaluate_shared, buffer.name, model)
+                       for attack, buffer in buffers.items() for model in models}
+            return {key: f.result() for key, f in futures.items()}
+    finally:
+        for buffer in buffers.values():
+            buffer.close()
+            buffer.unlink()
+
+
+if __name__ == "__main__":
+    start = time.time()
+    scores = simulate_and_evaluate()
+    for (attack, model), r2 in scores.items():
+        print(f"  {attack:<18} {model:<14} R2={r2:.4f}")
+    print(f"\n✅ Simulate-and-evaluate sweep finished in {time.time() - start:.2f}s (no CSV written)")
@@ -0,0 +1,307 @@
+"""
+Consolidated, memory-mapped telemetry store for every AirSim drone log.
+
+The trusted baseline log and the four attack logs are normalized into one
+schema and written as one ``.npy`` file per column.  Columns are opened with
+``mmap_mode='r'`` so evaluation and plotting code only pages in the rows it
+slices.  Precomputed indexes by attack, iteration and drone turn a lookup into
+an offset read instead of a scan over the whole dataset.
+
+Usage:
+    python telemetry_store.py            # build ../data/telemetry_store
+    store = TelemetryStore.open()        # build on first use, then mmap
+    X, y = load_attack_xy(store, "Sybil Attack")
+"""
+import json
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data")
+RESULT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "result")
+DEFAULT_STORE_DIR = os.path.join(DATA_DIR, "telemetry_store")
+
+# === Source Logs ===
+ATTACK_FILES = {
+    "Trustworthy": "drone_simulation_log.csv",
+    "Critical Node": "drone_simulation_log_critical_node.csv",
+    "Data Manipulation": "drone_simulation_log_data_manipulation.csv",
+    "MITM Attack": "drone_simulation_log_mitm.csv",
+    "Sybil Attack": "drone_sybil_attack.csv"
+}
+
+# === Normalized Schema ===
+NUMERIC_COLUMNS = [
+    "Degree Centrality", "Betweenness Centrality", "Closeness Centrality", "Eigenvector Centrality",
+    "Battery Level", "Sensor Functionality", "Relative Speed", "Location Accuracy",
+    "Communication Intensity", "Communication Scale", "Scale-Intensity Centrality",
+    "Latency", "Data Throughput", "Packet Loss", "Swarm Coordination Rate", "Trust Score",
+    "Total Times Attacked", "Neighbor Count"
+]
+CATEGORICAL_COLUMNS = [
+    "Attack", "Drone", "Attack Type", "Trust Status",
+    "Speed Match", "Sensor Match", "Centrality Match"
+]
+INDEXED_COLUMNS = ["Attack", "Iteration", "Drone"]
+
+# === Model Features (same as the evaluation notebooks) ===
+FEATURES = [
+    "Trust Score", "Latency", "Packet Loss", "Relative Speed",
+    "Location Accuracy", "Battery Level Norm",
+    "Scale-Intensity Centrality", "Closeness Centrality"
+]
+TARGET = "Swarm Coordination Rate"
+
+
+def column_file(name):
+    return re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_") + ".npy"
+
+
+def engineer_features(cols):
+    """
+    Adds the derived notebook features to a DataFrame or a dict of column arrays.
+    Note: "Trust Score" is recomputed exactly like the notebooks do, overwriting the logged value.
+    """
+    cols["Battery Level Norm"] = cols["Battery Level"] / 100
+    cols["Scale-Intensity Centrality"] = cols["Communication Intensity"] * cols["Communication Scale"]
+    cols["Trust Score"] = (
+        0.2 * (1 - cols["Latency"]) +
+        0.1 * (1 - cols["Packet Loss"]) +
+        0.2 * cols["Sensor Functionality"] +
+        0.1 * cols["Battery Level Norm"] +
+        0.2 * cols["Scale-Intensity Centrality"] +
+        0.1 * cols["Closeness Centrality"] +
+        0.1 * cols["Eigenvector Centrality"]
+    )
+    return cols
+
+
+# === Build ===
+def _normalize_chunk(chunk):
+    """Maps one CSV chunk (baseline or attack layout) onto the normalized schema."""
+    out = {}
+    for col in NUMERIC_COLUMNS:
+        if col in chunk:
+            out[col] = chunk[col].to_numpy(dtype=np.float64)
+        else:
+            out[col] = np.full(len(chunk), np.nan)
+
+    if "Scale-Intensity Centrality" not in chunk:
+        out["Scale-Intensity Centrality"] = out["Communication Intensity"] * out["Communication Scale"]
+    if "Total Times Attacked" not in chunk:
+        out["Total Times Attacked"] = np.zeros(len(chunk))
+    out["Neighbor Count"] = chunk["Connected To"].fillna("").astype(str).str.count("'").to_numpy() / 2
+
+    out["Iteration"] = chunk["Iteration"].to_numpy(dtype=np.int32)
+    out["Drone"] = chunk["Drone"].astype(str).to_numpy()
+    for col in ["Attack Type", "Trust Status", "Speed Match", "Sensor Match", "Centrality Match"]:
+        out[col] = chunk[col].fillna("").astype(str).to_numpy() if col in chunk else np.full(len(chunk), "")
+    return out
+
+
+def _encode(values, vocab):
+    """Encodes strings against a growing vocabulary (list + dict lookup)."""
+    lookup = {v: i for i, v in enumerate(vocab)}
+    codes = np.empty(len(values), dtype=np.int32)
+    for i, v in enumerate(values):
+        code = lookup.get(v)
+        if code is None:
+            code = lookup[v] = len(vocab)
+            vocab.append(v)
+        codes[i] = code
+    return codes
+
+
+def _build_index(codes, n_keys):
+    """CSR-style index: rows for key k are order[offsets[k]:offsets[k + 1]] (ascending)."""
+    order = np.argsort(codes, kind="stable").astype(np.int64)
+    offsets = np.searchsorted(codes[order], np.arange(n_keys + 1)).astype(np.int64)
+    return order, offsets
+
+
+def build_store(store_dir=DEFAULT_STORE_DIR, data_dir=DATA_DIR, attack_files=ATTACK_FILES, chunksize=200_000):
+    """
+    Streams every CSV into per-column memory-mapped files and writes the indexes.
+    Only one chunk of one file is held in RAM at a time.
+    """
+    os.makedirs(store_dir, exist_ok=True)
+
+    # Pass 1: row counts, so every column can be preallocated on disk
+    n_rows = 0
+    for filename in attack_files.values():
+        for chunk in pd.read_csv(os.path.join(data_dir, filename), usecols=["Iteration"], chunksize=chunksize):
+            n_rows += len(chunk)
+
+    columns = {}
+    for col in NUMERIC_COLUMNS:
+        columns[col] = np.lib.format.open_memmap(
+            os.path.join(store_dir, column_file(col)), mode="w+", dtype=np.float64, shape=(n_rows,))
+    for col in CATEGORICAL_COLUMNS + ["Iteration"]:
+        columns[col] = np.lib.format.open_memmap(
+            os.path.join(store_dir, column_file(col)), mode="w+", dtype=np.int32, shape=(n_rows,))
+
+    vocabularies = {col: [] for col in CATEGORICAL_COLUMNS}
+    vocabularies["Attack"] = list(attack_files.keys())
+
+    # Pass 2: normalize and fill
+    start = 0
+    for attack_code, filename in enumerate(attack_files.values()):
+        for chunk in pd.read_csv(os.path.join(data_dir, filename), chunksize=chunksize):
+            rows = _normalize_chunk(chunk)
+            stop = start + len(chunk)
+            for col in NUMERIC_COLUMNS:
+                columns[col][start:stop] = rows[col]
+            columns["Iteration"][start:stop] = rows["Iteration"]
+            columns["Attack"][start:stop] = attack_code
+            for col in CATEGORICAL_COLUMNS[1:]:
+                columns[col][start:stop] = _encode(rows[col], vocabularies[col])
+            start = stop
+
+    for col in columns.values():
+        col.flush()
+
+    # Indexes by attack, iteration and drone
+    n_keys = {
+        "Attack": len(vocabularies["Attack"]),
+        "Iteration": int(columns["Iteration"].max()) + 1 if n_rows else 0,
+        "Drone": len(vocabularies["Drone"])
+    }
+    for col in INDEXED_COLUMNS:
+        order, offsets = _build_index(np.asarray(columns[col]), n_keys[col])
+        np.save(os.path.join(store_dir, "index_" + column_file(col)[:-4] + "_order.npy"), order)
+        np.save(os.path.join(store_dir, "index_" + column_file(col)[:-4] + "_offsets.npy"), offsets)
+
+    meta = {
+        "n_rows": n_rows,
+        "numeric_columns": NUMERIC_COLUMNS,
+        "categorical_columns": CATEGORICAL_COLUMNS,
+        "vocabularies": vocabularies,
+        "sources": attack_files
+    }
+    with open(os.path.join(store_dir, "meta.json"), "w") as f:
+        json.dump(meta, f, indent=2)
+
+    print(f"[INFO] Telemetry store built: {n_rows} rows from {len(attack_files)} logs -> {store_dir}")
+    return TelemetryStore(store_dir)
+
+
+# === Read ===
+class TelemetryStore:
+    def __init__(self, store_dir=DEFAULT_STORE_DIR):
+        self.store_dir = store_dir
+        with open(os.path.join(store_dir, "meta.json")) as f:
+            self.meta = json.load(f)
+        self.vocabularies = self.meta["vocabularies"]
+        self._columns = {}
+        self._indexes = {}
+
+    @classmethod
+    def open(cls, store_dir=DEFAULT_STORE_DIR, data_dir=DATA_DIR, rebuild=False):
+        """Opens the store, building it from the CSV logs first if it does not exist yet."""
+        if rebuild or not os.path.exists(os.path.join(store_dir, "meta.json")):
+            return build_store(store_dir, data_dir)
+        return cls(store_dir)
+
+    def __len__(self):
+        return self.meta["n_rows"]
+
+    @property
+    def attacks(self):
+        return self.vocabularies["Attack"]
+
+    @property
+    def drones(self):
+        return self.vocabularies["Drone"]
+
+    def column(self, name):
+        """Returns the read-only memory-mapped column (no data is loaded until sliced)."""
+        if name not in self._columns:
+            self._columns[name] = np.load(os.path.join(self.store_dir, column_file(name)), mmap_mode="r")
+        return self._columns[name]
+
+    def _index(self, name):
+        if name not in self._indexes:
+            prefix = os.path.join(self.store_dir, "index_" + column_file(name)[:-4])
+            self._indexes[name] = (np.load(prefix + "_order.npy", mmap_mode="r"),
+                                   np.load(prefix + "_offsets.npy", mmap_mode="r"))
+        return self._indexes[name]
+
+    def _key(self, name, value):
+        """Index key of a filter value; -1 for unknown values, which match no rows."""
+        if name == "Iteration":
+            return int(value)
+        try:
+            return self.vocabularies[name].index(value)
+        except ValueError:
+            return -1
+
+    def _rows_for(self, name, values):
+        order, offsets = self._index(name)
+        if isinstance(values, (str, int, np.integer)):
+            values = [values]
+        parts = []
+        for value in values:
+            key = self._key(name, value)
+            if 0 <= key < len(offsets) - 1:
+                parts.append(order[offsets[key]:offsets[key + 1]])
+        if not parts:
+            return np.empty(0, dtype=np.int64)
+        return np.sort(np.concatenate(parts)) if len(parts) > 1 else np.asarray(parts[0])
+
+    def rows(self, attack=None, iteration=None, drone=None):
+        """
+        Returns the ascending row numbers matching every given filter.
+        Each filter accepts a single value or a list of values; unknown
+        attacks, iterations or drones match no rows.
+        """
+        result = None
+        for name, values in (("Attack", attack), ("Iteration", iteration), ("Drone", drone)):
+            if values is None:
+                continue
+            matched = self._rows_for(name, values)
+            result = matched if result is None else np.intersect1d(result, matched, assume_unique=True)
+        if result is None:
+            return np.arange(len(self), dtype=np.int64)
+        return result
+
+    def select(self, columns=None, attack=None, iteration=None, drone=None, decode=False):
+        """
+        Slices the requested columns for the matching rows into a dict of arrays.
+        Only the selected rows are read from disk. With decode=True categorical
+        columns are returned as their string labels instead of integer codes.
+        """
+        columns = columns or NUMERIC_COLUMNS + CATEGORICAL_COLUMNS + ["Iteration"]
+        idx = self.rows(attack, iteration, drone)
+        out = {}
+        for col in columns:
+            values = self.column(col)[idx]
+            if decode and col in self.vocabularies:
+                values = np.asarray(self.vocabularies[col], dtype=object)[values]
+            out[col] = values
+        return out
+
+    def frame(self, columns=None, attack=None, iteration=None, drone=None):
+        """Same as select(), returned as a decoded DataFrame for notebooks and plotting."""
+        columns = columns or ["Iteration", "Drone", "Attack Type", "Trust Status"] + NUMERIC_COLUMNS
+        return pd.DataFrame(self.select(columns, attack, iteration, drone, decode=True))
+
+
+def load_attack_xy(store, attack, features=FEATURES):
+    """Builds the notebook feature matrix X and target y for one attack log."""
+    needed = ["Battery Level", "Communication Intensity", "Communication Scale", "Latency", "Packet Loss",
+              "Sensor Functionality", "Closeness Centrality", "Eigenvector Centrality",
+              "Relative Speed", "Location Accuracy", TARGET]
+    cols = engineer_features(store.select(needed, attack=attack))
+    X = np.column_stack([cols[f] for f in features])
+    y = np.asarray(cols[TARGET])
+    return X, y
+
+
+if __name__ == "__main__":
+    store = build_store()
+    for attack in store.attacks:
+        idx = store.rows(attack=attack)
+        print(f"  {attack}: {len(idx)} rows, "
+              f"iterations {int(store.column('Iteration')[idx].min())}-{int(store.column('Iteration')[idx].max())}")
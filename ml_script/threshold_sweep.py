@@ -0,0 +1,166 @@
+"""
+Single-pass vectorized threshold sweep for every attack x model pair.
+
+The F1 and confusion-matrix notebooks binarize predictions at one fixed 0.85
+cut.  Here each pair's predictions are sorted once; cumulative sums over the
+sorted labels give TP/FP at every distinct threshold in one pass, from which
+precision, recall, F1, accuracy, ROC and PR curves and the best operating
+point all follow without re-running confusion_matrix per cut.
+
+Usage:
+    python threshold_sweep.py
+"""
+import os
+
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import MinMaxScaler
+
+from evaluation_models import MODELS, TABLE_KWARGS
+from telemetry_store import RESULT_DIR, TelemetryStore, load_attack_xy
+
+ATTACKS = ["Critical Node", "Data Manipulation", "MITM Attack", "Sybil Attack"]
+LABEL_THRESHOLD = 0.85
+
+CLASSIFIER_KWARGS = TABLE_KWARGS["F1"]
+
+
+def threshold_sweep(y_true, scores):
+    """
+    Confusion counts and metrics for every distinct threshold (predict 1 when score >= threshold).
+    Row 0 is threshold=+inf (nothing predicted positive), so curves start at the origin.
+    """
+    y_true = np.asarray(y_true).astype(bool)
+    scores = np.asarray(scores, dtype=np.float64)
+
+    order = np.argsort(-scores, kind="mergesort")
+    sorted_scores = scores[order]
+    sorted_true = y_true[order]
+
+    # Last position of every run of equal scores = cut point for that threshold
+    cuts = np.r_[np.flatnonzero(np.diff(sorted_scores)), len(sorted_scores) - 1]
+    tp = np.r_[0, np.cumsum(sorted_true)[cuts]]
+    fp = np.r_[0, np.cumsum(~sorted_true)[cuts]]
+    thresholds = np.r_[np.inf, sorted_scores[cuts]]
+
+    pos = int(y_true.sum())
+    neg = len(y_true) - pos
+    fn = pos - tp
+    tn = neg - fp
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        precision = np.where(tp + fp > 0, tp / (tp + fp), 1.0)
+        recall = tp / pos if pos else np.zeros(len(tp))
+        fpr = fp / neg if neg else np.zeros(len(fp))
+        f1 = np.where(precision + recall > 0, 2 * precision * recall / (precision + recall), 0.0)
+    accuracy = (tp + tn) / len(y_true)
+
+    return pd.DataFrame({
+        "Threshold": thresholds, "TP": tp, "FP": fp, "FN": fn, "TN": tn,
+        "Precision": precision, "Recall": recall, "FPR": fpr, "F1 Score": f1, "Accuracy": accuracy
+    })
+
+
+def at_threshold(curve, threshold):
+    """Reads the row for a fixed cut (e.g. the notebooks' 0.85) from a sweep, no recomputation."""
+    idx = np.searchsorted(-curve["Threshold"].to_numpy(), -threshold, side="right") - 1
+    return curve.iloc[idx]
+
+
+def summarize(curve):
+    """
+    ROC AUC, average precision and the max-F1 / max-Youden operating points of one sweep.
+    ROC AUC and average precision are NaN when the labels hold only one class.
+    """
+    recall = curve["Recall"].to_numpy()
+    fpr = curve["FPR"].to_numpy()
+    precision = curve["Precision"].to_numpy()
+
+    first = curve.iloc[0]
+    if first["TP"] + first["FN"] == 0 or first["FP"] + first["TN"] == 0:
+        roc_auc = avg_precision = np.nan
+    else:
+        roc_auc = float(np.sum(np.diff(fpr) * (recall[1:] + recall[:-1]) / 2))
+        avg_precision = float(np.sum(np.diff(recall) * precision[1:]))
+    best_f1 = curve.iloc[int(np.argmax(curve["F1 Score"].to_numpy()))]
+    best_j = curve.iloc[int(np.argmax(recall - fpr))]
+
+    return {
+        "ROC AUC": round(roc_auc, 4),
+        "Average Precision": round(avg_precision, 4),
+        "Best F1": round(float(best_f1["F1 Score"]), 4),
+        "Best F1 Threshold": round(float(best_f1["Threshold"]), 4),
+        "Youden Threshold": round(float(best_j["Threshold"]), 4)
+    }
+
+
+def sweep_all(predictions, fixed_threshold=LABEL_THRESHOLD):
+    """
+    predictions: {(attack, model): (y_binary, scores)}
+    Returns (summary_df, curves) with one summary row and one full curve per pair.
+    """
+    curves = {}
+    summary = []
+    for (attack, model), (y_binary, scores) in predictions.items():
+        curve = threshold_sweep(y_binary, scores)
+        curves[(attack, model)] = curve
+        fixed = at_threshold(curve, fixed_threshold)
+        summary.append({
+            "Attack": attack, "Model": model,
+            f"F1 @ {fixed_threshold}": round(float(fixed["F1 Score"]), 4),
+            **summarize(curve)
+        })
+    return pd.DataFrame(summary), curves
+
+
+def collect_predictions(store, attacks=ATTACKS, models=MODELS, label_threshold=LABEL_THRESHOLD):
+    """Trains each model on the binarized target exactly like the F1 notebook and predicts all rows."""
+    predictions = {}
+    for attack in attacks:
+        X, y = load_attack_xy(store, attack)
+        y_binary = (y >= label_threshold).astype(int)
+        if len(np.unique(y_binary)) < 2:
+            print(f"⚠️ Skipping {attack}: insufficient class diversity")
+            continue
+
+        X_scaled = MinMaxScaler().fit_transform(X)
+        X_train, _, y_train, _ = train_test_split(X_scaled, y_binary, test_size=0.2, random_state=42)
+        for model_name, model_fn in models.items():
+            preds = model_fn(X_train, y_train, X_scaled, **CLASSIFIER_KWARGS.get(model_name, {}))
+            predictions[(attack, model_name)] = (y_binary, preds)
+    return predictions
+
+
+def plot_curves(curves, save_path):
+    fig, (ax_roc, ax_pr) = plt.subplots(1, 2, figsize=(14, 6))
+    for (attack, model), curve in curves.items():
+        label = f"{attack} - {model}"
+        ax_roc.plot(curve["FPR"], curve["Recall"], label=label, linewidth=1.5)
+        ax_pr.plot(curve["Recall"], curve["Precision"], label=label, linewidth=1.5)
+
+    ax_roc.plot([0, 1], [0, 1], linestyle='--', color='gray')
+    ax_roc.set_title("ROC Curves")
+    ax_roc.set_xlabel("False Positive Rate")
+    ax_roc.set_ylabel("True Positive Rate")
+    ax_pr.set_title("Precision-Recall Curves")
+    ax_pr.set_xlabel("Recall")
+    ax_pr.set_ylabel("Precision")
+    ax_pr.legend(fontsize=7, loc="lower left")
+    for ax in (ax_roc, ax_pr):
+        ax.grid(True)
+
+    plt.tight_layout()
+    plt.savefig(save_path, dpi=300)
+    plt.close(fig)
+
+
+if __name__ == "__main__":
+    store = TelemetryStore.open()
+    summary_df, curves = sweep_all(collect_predictions(store))
+    print(summary_df.to_string(index=False))
+
+    save_path = os.path.join(RESULT_DIR, "threshold_sweep_curves.png")
+    plot_curves(curves, save_path)
+    print(f" ROC/PR curves saved to: {save_path}")
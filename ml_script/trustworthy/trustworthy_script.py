@@ -4,12 +4,12 @@ matplotlib.use('TkAgg')  # Use Tkinter-based backend for displaying graphs
 import airsim
 import networkx as nx
 import random
-import time
 import matplotlib.pyplot as plt
 import pandas as pd
 import csv
 import os
 from dt_plugin import DigitalTwinPlugin
+from pipeline_scheduler import Stage, TickPipeline
 
 # Initialize AirSim Client
 client = airsim.MultirotorClient()
@@ -104,38 +104,58 @@ def compute_centrality():
         return {}, {}, {}, {}
     return nx.degree_centrality(G), nx.betweenness_centrality(G), nx.closeness_centrality(G), nx.eigenvector_centrality(G, max_iter=1000)
 
-# **Log Data to CSV (ensures data is written)**
-def log_data_to_csv(iteration, degree_centrality, betweenness_centrality, closeness_centrality, eigenvector_centrality):
+# **Pipeline stage: telemetry acquisition (the only stage that talks to AirSim)**
+def acquire_telemetry(iteration):
+    return {
+        "iteration": iteration,
+        "actual": {drone: dt_plugin.get_actual_metrics(drone) for drone in all_drones}
+    }
+
+# **Pipeline stage: graph and centrality work**
+def compute_graph_metrics(frame):
+    frame["centrality"] = compute_centrality()
+    frame["neighbors"] = {drone: list(G.neighbors(drone)) if drone in G.nodes else "Disconnected" for drone in all_drones}
+    return frame
+
+# **Pipeline stage: digital twin verification**
+def verify_frame(frame):
     def label(delta_val):
         return "Matched" if delta_val < 0.1 else "Mismatched"
 
+    degree_centrality, betweenness_centrality, closeness_centrality, eigenvector_centrality = frame["centrality"]
+    rows = []
+    for drone in all_drones:
+        actual_data = dict(frame["actual"][drone])
+        actual_data['centrality'] = degree_centrality.get(drone, 0)
+
+        predicted_data = {
+            'speed': actual_data['speed'],
+            'centrality': degree_centrality.get(drone, 0),
+            'sensor_ok': actual_data['sensor_ok']
+        }
+
+        delta = dt_plugin.verify_drone(predicted_data, actual_data)
+        is_trustworthy = all(v < 0.1 for v in delta.values())
+
+        rows.append([
+            frame["iteration"], drone, frame["neighbors"][drone],
+            degree_centrality.get(drone, 0), betweenness_centrality.get(drone, 0), closeness_centrality.get(drone, 0), eigenvector_centrality.get(drone, 0),
+            battery_levels[drone], sensor_functionality[drone], actual_data['speed'], location_accuracy[drone],
+            communication_intensity[drone], communication_scale[drone], communication_intensity[drone] * communication_scale[drone],
+            latency[drone], data_throughput[drone], packet_loss[drone], swarm_coordination_rate[drone],
+            label(delta['speed']), label(delta['centrality']), label(delta['sensor']),
+            "TRUSTED" if is_trustworthy else "MALICIOUS"
+        ])
+    frame["rows"] = rows
+    return frame
+
+# **Pipeline stage: log sink (ensures data is written)**
+def log_data_to_csv(frame):
     with open(csv_file_path, "a", newline="") as file:
         writer = csv.writer(file)
-        for drone in all_drones:
-            connected_drones = list(G.neighbors(drone)) if drone in G.nodes else "Disconnected"
-
-            actual_data = dt_plugin.get_actual_metrics(drone)
-            actual_data['centrality'] = degree_centrality.get(drone, 0)
-
-            predicted_data = {
-                'speed': actual_data['speed'],
-                'centrality': degree_centrality.get(drone, 0),
-                'sensor_ok': actual_data['sensor_ok']
-            }
-
-            delta = dt_plugin.verify_drone(predicted_data, actual_data)
-            is_trustworthy = all(v < 0.1 for v in delta.values())
-
-            writer.writerow([
-                iteration, drone, connected_drones,
-                degree_centrality.get(drone, 0), betweenness_centrality.get(drone, 0), closeness_centrality.get(drone, 0), eigenvector_centrality.get(drone, 0),
-                battery_levels[drone], sensor_functionality[drone], actual_data['speed'], location_accuracy[drone],
-                communication_intensity[drone], communication_scale[drone], communication_intensity[drone] * communication_scale[drone],
-                latency[drone], data_throughput[drone], packet_loss[drone], swarm_coordination_rate[drone],
-                label(delta['speed']), label(delta['centrality']), label(delta['sensor']),
-                "TRUSTED" if is_trustworthy else "MALICIOUS"
-            ])
-    print(f"[INFO] CSV Data Logged for Iteration {iteration}")
+        writer.writerows(frame["rows"])
+    print(f"[INFO] CSV Data Logged for Iteration {frame['iteration']}")
+    return frame
 
 # **Plot network graph dynamically with improved readability**
 def plot_network(iteration):
@@ -156,11 +176,20 @@ def plot_network(iteration):
     plt.show(block=True)
 
 # **Run simulation loop**
-for iteration in range(5):
-    print(f"\n[INFO] Iteration {iteration+1}")
-    degree_centrality, betweenness_centrality, closeness_centrality, eigenvector_centrality = compute_centrality()
-    log_data_to_csv(iteration, degree_centrality, betweenness_centrality, closeness_centrality, eigenvector_centrality)
-    plot_network(iteration)
-    time.sleep(0.5)
+# Fixed 0.5 s tick; telemetry, centrality, verification and logging run as concurrent
+# stages with bounded queues, and rendering stays on the main (Tk) thread.
+pipeline = TickPipeline([
+    Stage("telemetry", acquire_telemetry),
+    Stage("centrality", compute_graph_metrics),
+    Stage("verification", verify_frame),
+    Stage("csv", log_data_to_csv)
+], tick_interval=0.5, queue_size=2)
+
+for frame in pipeline.run(5):
+    print(f"\n[INFO] Iteration {frame['iteration']+1}")
+    plot_network(frame["iteration"])
+
+for stage, stats in pipeline.stats().items():
+    print(f"[INFO] Stage {stage}: {stats['processed']} ticks, {stats['mean_seconds'] * 1000:.1f} ms/tick")
 
 print(f"\n[INFO] Simulation completed. Data saved at: {csv_file_path}")